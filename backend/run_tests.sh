@@ -90,6 +90,7 @@ case $COMMAND in
         echo -e "${YELLOW}Q-LLM Intent Extraction (Most Critical)${NC}"
         $PYTEST_CMD \
             src/integrations/zendesk/langgraph_agent/nodes/tests/test_intent_extraction_node.py \
+            src/integrations/zendesk/langgraph_agent/nodes/tests/test_intent_extraction_security.py \
             -v
         ;;
 
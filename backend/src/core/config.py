@@ -39,6 +39,9 @@ class Settings(BaseSettings):
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8080"]
     CORS_HEADERS: list[str] = ["*"]
 
+    # Conversation Configuration (OPTIONAL - has defaults)
+    MAX_HISTORY_TOKENS: int = 3000  # History budget re-sent to the LLM each turn
+
     # Application Version (OPTIONAL)
     APP_VERSION: str = "1.0.0"
 
@@ -5,8 +5,10 @@ This module provides a reusable HTTP client with built-in retry logic,
 error handling, and rate limiting for all external integrations.
 """
 import asyncio
-from typing import Dict, Optional, Any, Protocol
+import time
+from typing import Dict, Optional, Any, Mapping, Protocol
 import httpx
+import orjson
 
 from .logging_config import get_logger, log_with_context
 
@@ -42,6 +44,40 @@ class APIError(Exception):
         return base_msg
 
 
+class RateLimitGovernor:
+    """Holds requests back once the server reports its rate-limit window is spent.
+
+    Reads the ``ratelimit-remaining`` / ``ratelimit-reset`` headers (seconds until
+    the window resets) so callers pause before hitting a 429 instead of after.
+    """
+
+    def __init__(self):
+        self._resume_at = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the rate-limit state reported by a response."""
+        try:
+            remaining = int(headers.get("ratelimit-remaining"))
+            reset_after = int(headers.get("ratelimit-reset"))
+        except (TypeError, ValueError):
+            return
+
+        if remaining <= 0:
+            self._resume_at = time.monotonic() + reset_after
+
+    async def wait(self) -> None:
+        """Sleep until the current rate-limit window resets, if it is spent."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            log_with_context(
+                logger,
+                30,  # WARNING
+                f"Rate limit window exhausted, pausing {delay:.1f} seconds",
+                delay=delay
+            )
+            await asyncio.sleep(delay)
+
+
 class AsyncHTTPClient:
     """Generic async HTTP client with retry logic and error handling."""
 
@@ -50,6 +86,7 @@ class AsyncHTTPClient:
         self.headers = headers
         self.config = config
         self._client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = RateLimitGovernor()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -108,12 +145,14 @@ class AsyncHTTPClient:
                     url=url
                 )
 
+                await self.rate_limiter.wait()
                 response = await self.client.request(
                     method=method,
                     url=url,
                     json=data,
                     params=params
                 )
+                self.rate_limiter.update(response.headers)
 
                 # Handle rate limiting
                 if response.status_code == 429:
@@ -130,7 +169,7 @@ class AsyncHTTPClient:
 
                 # Handle other HTTP errors
                 if response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
+                    error_data = orjson.loads(response.content) if response.content else {}
                     log_with_context(
                         logger,
                         40,  # ERROR
@@ -144,8 +183,8 @@ class AsyncHTTPClient:
                         response_data=error_data
                     )
 
-                # Success
-                result = response.json()
+                # Success (orjson parses the raw bytes, skipping httpx's text decode)
+                result = orjson.loads(response.content)
                 log_with_context(
                     logger,
                     20,  # INFO
@@ -6,6 +6,7 @@ import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock
 from typing import Dict, Any
 import httpx
+import orjson
 
 from src.core.http_client import AsyncHTTPClientConfig, APIError
 
@@ -64,8 +65,7 @@ def mock_httpx_response():
     response = Mock(spec=httpx.Response)
     response.status_code = 200
     response.headers = {}
-    response.content = b'{"status": "success"}'
-    response.json.return_value = {"status": "success"}
+    response.content = orjson.dumps({"status": "success"})
     return response
 
 
@@ -75,8 +75,7 @@ def mock_error_response():
     response = Mock(spec=httpx.Response)
     response.status_code = 400
     response.headers = {}
-    response.content = b'{"error": "Bad Request"}'
-    response.json.return_value = {"error": "Bad Request"}
+    response.content = orjson.dumps({"error": "Bad Request"})
     return response
 
 
@@ -86,6 +85,5 @@ def mock_rate_limit_response():
     response = Mock(spec=httpx.Response)
     response.status_code = 429
     response.headers = {"Retry-After": "30"}
-    response.content = b'{"error": "Rate Limited"}'
-    response.json.return_value = {"error": "Rate Limited"}
+    response.content = orjson.dumps({"error": "Rate Limited"})
     return response
\ No newline at end of file
@@ -5,9 +5,10 @@ import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch, Mock
 import httpx
+import orjson
 import asyncio
 
-from src.core.http_client import AsyncHTTPClient, APIError, AsyncHTTPClientConfig
+from src.core.http_client import AsyncHTTPClient, APIError, AsyncHTTPClientConfig, RateLimitGovernor
 
 
 class TestAsyncHTTPClient:
@@ -83,7 +84,7 @@ class TestAsyncHTTPClient:
         mock_httpx_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = success_response
+        mock_response.content = orjson.dumps(success_response)
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -105,7 +106,7 @@ class TestAsyncHTTPClient:
         mock_httpx_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = success_response
+        mock_response.content = orjson.dumps(success_response)
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -130,8 +131,7 @@ class TestAsyncHTTPClient:
         mock_httpx_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.content = b'{"error": "Bad Request"}'
-        mock_response.json.return_value = error_response
+        mock_response.content = orjson.dumps(error_response)
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -157,8 +157,7 @@ class TestAsyncHTTPClient:
         mock_httpx_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_response.content = b'{"error": "Not Found"}'
-        mock_response.json.return_value = {"error": "Not Found"}
+        mock_response.content = orjson.dumps({"error": "Not Found"})
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -183,7 +182,7 @@ class TestAsyncHTTPClient:
         # Second response: success
         success_mock_response = Mock()
         success_mock_response.status_code = 200
-        success_mock_response.json.return_value = success_response
+        success_mock_response.content = orjson.dumps(success_response)
 
         mock_httpx_client.request.side_effect = [rate_limit_response, success_mock_response]
 
@@ -210,7 +209,7 @@ class TestAsyncHTTPClient:
         # Second response: success
         success_mock_response = Mock()
         success_mock_response.status_code = 200
-        success_mock_response.json.return_value = success_response
+        success_mock_response.content = orjson.dumps(success_response)
 
         mock_httpx_client.request.side_effect = [rate_limit_response, success_mock_response]
 
@@ -234,7 +233,7 @@ class TestAsyncHTTPClient:
         # Third attempt: success
         success_mock_response = Mock()
         success_mock_response.status_code = 200
-        success_mock_response.json.return_value = success_response
+        success_mock_response.content = orjson.dumps(success_response)
 
         mock_httpx_client.request.side_effect = [
             network_error,
@@ -275,7 +274,7 @@ class TestAsyncHTTPClient:
         mock_httpx_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = success_response
+        mock_response.content = orjson.dumps(success_response)
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -303,7 +302,6 @@ class TestAsyncHTTPClient:
         mock_response = Mock()
         mock_response.status_code = 500
         mock_response.content = b''  # Empty response
-        mock_response.json.return_value = {}
         mock_httpx_client.request.return_value = mock_response
 
         client = AsyncHTTPClient(base_url, sample_headers, mock_config)
@@ -315,6 +313,59 @@ class TestAsyncHTTPClient:
         assert exc_info.value.status_code == 500
         assert "Unknown error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_make_request_pauses_when_rate_limit_spent(self, base_url, sample_headers, mock_config, success_response):
+        """Test the next request waits once the server reports no requests remaining."""
+        mock_httpx_client = AsyncMock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ratelimit-remaining": "0", "ratelimit-reset": "5"}
+        mock_response.content = orjson.dumps(success_response)
+        mock_httpx_client.request.return_value = mock_response
+
+        client = AsyncHTTPClient(base_url, sample_headers, mock_config)
+        client._client = mock_httpx_client
+
+        with patch('asyncio.sleep') as mock_sleep:
+            await client.make_request("GET", "test/endpoint")
+            mock_sleep.assert_not_called()
+
+            await client.make_request("GET", "test/endpoint")
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 5
+
+
+class TestRateLimitGovernor:
+    """Test header-driven rate-limit pausing."""
+
+    @pytest.mark.asyncio
+    async def test_no_pause_while_requests_remain(self):
+        """Test no wait while the window still has requests left."""
+        governor = RateLimitGovernor()
+        governor.update({"ratelimit-remaining": "10", "ratelimit-reset": "30"})
+
+        with patch('asyncio.sleep') as mock_sleep:
+            await governor.wait()
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers", [
+        {},
+        {"ratelimit-remaining": "0"},
+        {"ratelimit-remaining": "soon", "ratelimit-reset": "30"},
+    ])
+    async def test_missing_or_invalid_headers_ignored(self, headers):
+        """Test responses without usable rate-limit headers never pause."""
+        governor = RateLimitGovernor()
+        governor.update(headers)
+
+        with patch('asyncio.sleep') as mock_sleep:
+            await governor.wait()
+
+        mock_sleep.assert_not_called()
+
 
 class TestAPIError:
     """Test APIError exception class."""
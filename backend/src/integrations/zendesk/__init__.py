@@ -4,7 +4,13 @@ Zendesk integration module.
 This module provides essential Zendesk API integration including
 client, configuration, models, and chat AI agent.
 """
-from .client import ZendeskClient, ZendeskPaginator, get_zendesk_client
+from .client import (
+    ZendeskClient,
+    ZendeskPaginator,
+    get_zendesk_client,
+    get_shared_zendesk_client,
+    close_shared_zendesk_client
+)
 from .config import zendesk_config
 from .models import (
     ZendeskTicket,
@@ -12,7 +18,7 @@ from .models import (
     PaginatedTicketsResponse
 )
 from .chat_router import router as chat_router
-from .service import TicketService
+from .service import TicketService, get_shared_ticket_service
 from .exceptions_api import (
     ZendeskServiceUnavailableException,
     ZendeskConnectionException,
@@ -27,12 +33,15 @@ __all__ = [
     "ZendeskClient",
     "ZendeskPaginator",
     "get_zendesk_client",
+    "get_shared_zendesk_client",
+    "close_shared_zendesk_client",
     "zendesk_config",
     "ZendeskTicket",
     "ZendeskResponse",
     "PaginatedTicketsResponse",
     "chat_router",
     "TicketService",
+    "get_shared_ticket_service",
     "ZendeskServiceUnavailableException",
     "ZendeskConnectionException",
     "ZendeskAuthenticationException",
@@ -68,7 +68,9 @@ async def chat(request: ChatRequest) -> ChatResponse:
         # Configure with thread ID for memory persistence
         config = {"configurable": {"thread_id": session_id}}
 
-        # Use async invoke since graph nodes are async
+        # Use async invoke since graph nodes are async. Replies are not
+        # streamed: output_sanitization must see the full agent response
+        # before any of it reaches the client.
         result = await awesome_company_graph.ainvoke(
             {"messages": [HumanMessage(content=request.message)]},
             config
@@ -4,18 +4,32 @@ Zendesk API client for basic ticket operations.
 This module provides a simplified client for interacting with the Zendesk API,
 focusing on essential ticket operations with cursor-based pagination.
 """
+import asyncio
 import base64
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
 from src.core.logging_config import get_logger, log_with_context
 from src.core.http_client import AsyncHTTPClient
 from .config import zendesk_config
 from .exceptions import ZendeskAPIError
-from .models import ZendeskTicket, ZendeskResponse, PaginatedTicketsResponse
+from .models import (
+    TICKET_LIST_ADAPTER,
+    ZendeskTicket,
+    ZendeskResponse,
+    PaginatedTicketsResponse
+)
 
 logger = get_logger("zendesk_client")
 
 
+@lru_cache(maxsize=4)
+def _basic_auth_header(email: str, token: str) -> str:
+    """Build the API-token Basic auth header value, once per credential pair."""
+    auth_bytes = f"{email}/token:{token}".encode('utf-8')
+    return f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+
+
 class ZendeskPaginator:
     """Cursor-based paginator for Zendesk API responses."""
 
@@ -91,12 +105,8 @@ class ZendeskClient:
 
     async def connect(self) -> None:
         """Initialize the HTTP client with authentication."""
-        auth_string = f"{self.config.EMAIL}/token:{self.config.TOKEN}"
-        auth_bytes = auth_string.encode('utf-8')
-        auth_header = base64.b64encode(auth_bytes).decode('utf-8')
-
         headers = {
-            "Authorization": f"Basic {auth_header}",
+            "Authorization": _basic_auth_header(self.config.EMAIL, self.config.TOKEN),
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
@@ -144,6 +154,10 @@ class ZendeskClient:
             custom_error_class=ZendeskAPIError
         )
 
+    async def healthcheck(self) -> None:
+        """Make a cheap authenticated request, opening a pooled connection."""
+        await self._make_request("GET", "users/me.json")
+
     # Pagination Methods
     def get_tickets_paginated(
         self,
@@ -201,7 +215,7 @@ class ZendeskClient:
             all_tickets = []
 
             async for page_data in paginator:
-                tickets = [ZendeskTicket(**ticket) for ticket in page_data.get("tickets", [])]
+                tickets = TICKET_LIST_ADAPTER.validate_python(page_data.get("tickets", []))
                 all_tickets.extend(tickets)
 
                 if len(all_tickets) >= 10000:
@@ -222,7 +236,7 @@ class ZendeskClient:
                 params["per_page"] = min(page_size, self.config.MAX_PAGE_SIZE)
 
             response_data = await self._make_request("GET", "tickets.json", params=params)
-            return [ZendeskTicket(**ticket) for ticket in response_data.get("tickets", [])]
+            return TICKET_LIST_ADAPTER.validate_python(response_data.get("tickets", []))
 
     async def get_all_tickets(
         self,
@@ -235,7 +249,7 @@ class ZendeskClient:
         page_count = 0
 
         async for page_data in paginator:
-            tickets = [ZendeskTicket(**ticket) for ticket in page_data.get("tickets", [])]
+            tickets = TICKET_LIST_ADAPTER.validate_python(page_data.get("tickets", []))
             all_tickets.extend(tickets)
             page_count += 1
 
@@ -376,10 +390,10 @@ class ZendeskClient:
             response_data = await self._make_request("GET", "search.json", params=params)
 
             # Parse tickets from search results
-            tickets = []
-            for result in response_data.get("results", []):
-                if result.get("result_type") == "ticket":
-                    tickets.append(ZendeskTicket(**result))
+            tickets = TICKET_LIST_ADAPTER.validate_python([
+                result for result in response_data.get("results", [])
+                if result.get("result_type") == "ticket"
+            ])
 
             log_with_context(
                 logger,
@@ -411,10 +425,154 @@ class ZendeskClient:
             )
             raise ZendeskAPIError(f"Unexpected error searching tickets: {str(e)}")
 
+    async def search_tickets_by_emails(
+        self, customer_emails: List[str]
+    ) -> Dict[str, List[ZendeskTicket]]:
+        """
+        Search tickets for several customer emails with a single Search API query.
+
+        Repeated ``requester:`` terms are OR-ed by Zendesk search; requesters are
+        side-loaded so results can be grouped back by email. Result pages are
+        read up to the Search API's result limit; anything past it is dropped.
+
+        Args:
+            customer_emails: Customer email addresses to search for
+
+        Returns:
+            Mapping of each requested email to its matching tickets
+
+        Raises:
+            ZendeskAPIError: If search fails
+        """
+        if not customer_emails:
+            return {}
+
+        try:
+            requester_terms = " ".join(f"requester:{email}" for email in customer_emails)
+            params = {
+                "query": f"type:ticket {requester_terms}",
+                "sort_by": "updated_at",
+                "sort_order": "desc",
+                "include": "tickets(users)",
+                "per_page": self.config.MAX_PAGE_SIZE
+            }
+
+            log_with_context(
+                logger,
+                20,  # INFO
+                "Searching tickets by emails",
+                email_count=len(customer_emails)
+            )
+
+            # Follow next_page so one busy requester can't crowd the others out,
+            # but stop at the Search API result limit: later pages return 422
+            results = []
+            email_by_user_id = {}
+            max_pages = -(-self.config.SEARCH_RESULT_LIMIT // self.config.MAX_PAGE_SIZE)
+            for page in range(1, max_pages + 1):
+                response_data = await self._make_request(
+                    "GET", "search.json", params={**params, "page": page}
+                )
+                results.extend(response_data.get("results", []))
+                for user in response_data.get("users", []):
+                    # Zendesk returns a null email for users without one
+                    email_by_user_id[user["id"]] = (user.get("email") or "").lower()
+                if not response_data.get("next_page"):
+                    break
+            else:
+                log_with_context(
+                    logger,
+                    30,  # WARNING
+                    "Ticket search results truncated at the Search API limit",
+                    email_count=len(customer_emails),
+                    result_limit=self.config.SEARCH_RESULT_LIMIT
+                )
+
+            tickets_by_email = {email.lower(): [] for email in customer_emails}
+            tickets = TICKET_LIST_ADAPTER.validate_python([
+                result for result in results
+                if result.get("result_type") == "ticket"
+            ])
+            for ticket in tickets:
+                email = email_by_user_id.get(ticket.requester_id)
+                if email in tickets_by_email:
+                    tickets_by_email[email].append(ticket)
+
+            log_with_context(
+                logger,
+                20,  # INFO
+                "Successfully found tickets by emails",
+                email_count=len(customer_emails),
+                ticket_count=len(tickets)
+            )
+
+            return {email: tickets_by_email[email.lower()] for email in customer_emails}
+
+        except ZendeskAPIError as e:
+            log_with_context(
+                logger,
+                40,  # ERROR
+                "Failed to search tickets by emails",
+                email_count=len(customer_emails),
+                error=str(e)
+            )
+            raise
+
+        except Exception as e:
+            log_with_context(
+                logger,
+                40,  # ERROR
+                "Unexpected error searching tickets by emails",
+                email_count=len(customer_emails),
+                error=str(e)
+            )
+            raise ZendeskAPIError(f"Unexpected error searching tickets: {str(e)}")
 
 
 async def get_zendesk_client() -> ZendeskClient:
     """Get a Zendesk client instance."""
     client = ZendeskClient()
     await client.connect()
-    return client
\ No newline at end of file
+    return client
+
+
+
+# Process-wide client so tool calls reuse one HTTP connection pool
+_shared_client: Optional[ZendeskClient] = None
+_shared_client_lock = asyncio.Lock()
+
+
+async def get_shared_zendesk_client() -> ZendeskClient:
+    """Get the shared Zendesk client, connecting it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        async with _shared_client_lock:
+            if _shared_client is None:
+                client = ZendeskClient()
+                await client.connect()
+                _shared_client = client
+    return _shared_client
+
+
+async def close_shared_zendesk_client() -> None:
+    """Disconnect the shared Zendesk client if it was opened."""
+    global _shared_client
+    async with _shared_client_lock:
+        if _shared_client is not None:
+            await _shared_client.disconnect()
+            _shared_client = None
+
+
+async def warm_up_shared_zendesk_client() -> None:
+    """Open the shared client's connection ahead of the first tool call."""
+    try:
+        zendesk_client = await get_shared_zendesk_client()
+        await zendesk_client.healthcheck()
+        log_with_context(logger, 20, "Zendesk connection warmed up")
+    except Exception as e:
+        log_with_context(
+            logger,
+            30,  # WARNING
+            "Zendesk warm-up failed, connecting on first use",
+            error=str(e)
+        )
@@ -32,6 +32,7 @@ class ZendeskConfig:
 
     DEFAULT_PAGE_SIZE: int = 100
     MAX_PAGE_SIZE: int = 100  # Zendesk max
+    SEARCH_RESULT_LIMIT: int = 1000  # Search API rejects pages past this many results
 
 
 # Global instance
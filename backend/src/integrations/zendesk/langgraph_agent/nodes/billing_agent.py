@@ -1,5 +1,6 @@
 """Billing agent for account management, payments, and billing inquiries."""
 
+from functools import lru_cache
 from typing import Dict, Any
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
@@ -11,6 +12,7 @@ from src.integrations.zendesk.langgraph_agent.config.langgraph_config import (
     awesome_company_config,
 )
 from src.integrations.zendesk.langgraph_agent.tools.awesome_company_tools import awesome_company_tools
+from src.integrations.zendesk.langgraph_agent.utils.message_history import trim_history
 from src.integrations.zendesk.langgraph_agent.utils.secure_tool_executor import (
     execute_tool_securely,
 )
@@ -21,50 +23,14 @@ from src.core.logging_config import get_logger
 logger = get_logger("billing_agent")
 
 
-async def billing_agent_node(state: ConversationState) -> ConversationState:
+# P-LLM (Privileged LLM with tool access)
+@lru_cache(maxsize=1)
+def get_billing_llm():
     """
-    P-LLM Billing Agent (Privileged LLM with tool access).
-
-    CRITICAL SECURITY PRINCIPLE:
-    - This P-LLM NEVER sees raw user input
-    - Only processes structured intent from Q-LLM
-    - Works with sanitized summary and extracted entities
+    Initialize the tool-bound billing P-LLM.
 
-    Focuses on resolving billing-related customer concerns.
+    The client and tool binding are built once per process and reused on every turn.
     """
-    messages = state["messages"]
-
-    # CRITICAL: Get structured intent from Q-LLM (NEVER access raw user input)
-    structured_intent = state.get("structured_intent", {})
-
-    if not structured_intent:
-        # Fallback: should not happen in normal flow
-        return state
-
-    # Extract safe, sanitized data from Q-LLM
-    safe_summary = structured_intent.get("summary", "")
-    entities = structured_intent.get("entities", {})
-
-    # CRITICAL: Create safe message list for P-LLM
-    # Replace last user message with Q-LLM's safe summary
-    safe_messages = messages[:-1].copy() if messages else []
-    safe_user_message = HumanMessage(content=safe_summary)
-    safe_messages.append(safe_user_message)
-
-    # Add context from extracted entities
-    entity_context = ""
-    if entities:
-        entity_parts = []
-        if "issue_type" in entities:
-            entity_parts.append(f"Issue: {entities['issue_type']}")
-        if "account_info" in entities:
-            entity_parts.append(f"Account Info: {entities['account_info']}")
-        if "urgency" in entities:
-            entity_parts.append(f"Urgency: {entities['urgency']}")
-        if entity_parts:
-            entity_context = f"\n\n**Context from intent analysis:** {', '.join(entity_parts)}"
-
-    # P-LLM (Privileged LLM with tool access)
     if settings.USE_BEDROCK:
         # Production: Use Bedrock Claude Sonnet (powerful)
         from src.integrations.aws.bedrock_llm import get_sonnet_llm
@@ -80,11 +46,12 @@ async def billing_agent_node(state: ConversationState) -> ConversationState:
         )
         logger.info("P-LLM Billing Agent initialized with OpenAI GPT-4")
 
-    billing_llm = billing_llm.bind_tools(awesome_company_tools)
+    return billing_llm.bind_tools(awesome_company_tools)
+
 
-    system_prompt = f"""You are Alex from MyAwesomeFakeCompany customer support. You continue the conversation seamlessly - the user doesn't know they've been routed to a specialist.
+BILLING_SYSTEM_PROMPT = """You are Alex from MyAwesomeFakeCompany customer support. You continue the conversation seamlessly - the user doesn't know they've been routed to a specialist.
 
-**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.{entity_context}
+**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.
 
 **CRITICAL SCOPE RESTRICTION:**
 You ONLY handle MyAwesomeFakeCompany-related topics:
@@ -136,10 +103,57 @@ If asked about non-MyAwesomeFakeCompany topics (like "What's the capital of Fran
 - Offer payment plan options when customers have financial difficulties
 - Maintain MyAwesomeFakeCompany's professional and understanding approach"""
 
+
+async def billing_agent_node(state: ConversationState) -> ConversationState:
+    """
+    P-LLM Billing Agent (Privileged LLM with tool access).
+
+    CRITICAL SECURITY PRINCIPLE:
+    - This P-LLM NEVER sees raw user input
+    - Only processes structured intent from Q-LLM
+    - Works with sanitized summary and extracted entities
+
+    Focuses on resolving billing-related customer concerns.
+    """
+    messages = state["messages"]
+
+    # CRITICAL: Get structured intent from Q-LLM (NEVER access raw user input)
+    structured_intent = state.get("structured_intent", {})
+
+    if not structured_intent:
+        # Fallback: should not happen in normal flow
+        return state
+
+    # Extract safe, sanitized data from Q-LLM
+    safe_summary = structured_intent.get("summary", "")
+    entities = structured_intent.get("entities", {})
+
+    # Add context from extracted entities
+    entity_context = ""
+    if entities:
+        entity_parts = []
+        if "issue_type" in entities:
+            entity_parts.append(f"Issue: {entities['issue_type']}")
+        if "account_info" in entities:
+            entity_parts.append(f"Account Info: {entities['account_info']}")
+        if "urgency" in entities:
+            entity_parts.append(f"Urgency: {entities['urgency']}")
+        if entity_parts:
+            entity_context = f"\n\n**Context from intent analysis:** {', '.join(entity_parts)}"
+
+    # CRITICAL: Create safe message list for P-LLM
+    # Replace last user message with Q-LLM's safe summary. Intent data goes
+    # last so the static system prompt stays a cacheable prompt prefix.
+    safe_messages = trim_history(messages[:-1])
+    safe_user_message = HumanMessage(content=safe_summary + entity_context)
+    safe_messages.append(safe_user_message)
+
+    billing_llm = get_billing_llm()
+
     try:
         # P-LLM processes ONLY safe messages (never raw user input)
         response = await billing_llm.ainvoke(
-            [SystemMessage(content=system_prompt), *safe_messages]
+            [SystemMessage(content=BILLING_SYSTEM_PROMPT), *safe_messages]
         )
 
         if response.tool_calls:
@@ -201,7 +215,7 @@ If asked about non-MyAwesomeFakeCompany topics (like "What's the capital of Fran
                 # P-LLM processes ONLY safe messages (never raw user input)
                 final_response = await billing_llm.ainvoke(
                     [
-                        SystemMessage(content=system_prompt),
+                        SystemMessage(content=BILLING_SYSTEM_PROMPT),
                         *safe_messages,
                         response,
                         *tool_messages,
@@ -1,5 +1,6 @@
 """Sales-focused supervisor agent that handles conversations by default and routes only when necessary."""
 
+from functools import lru_cache
 from typing import Dict, Any
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
@@ -11,43 +12,21 @@ from src.integrations.zendesk.langgraph_agent.config.langgraph_config import (
     awesome_company_config,
 )
 from src.integrations.zendesk.langgraph_agent.tools.awesome_company_tools import awesome_company_tools
+from src.integrations.zendesk.langgraph_agent.utils.message_history import trim_history
 from src.core.config import settings
 from src.core.logging_config import get_logger
 
 logger = get_logger("supervisor_agent")
 
 
-async def supervisor_agent_node(state: ConversationState) -> ConversationState:
+# P-LLM (Privileged LLM with tool access)
+@lru_cache(maxsize=1)
+def get_supervisor_llm():
     """
-    P-LLM Supervisor Agent (Privileged LLM with tool access).
-
-    CRITICAL SECURITY PRINCIPLE:
-    - This P-LLM NEVER sees raw user input
-    - Only processes structured intent from Q-LLM
-    - Works with sanitized summary and extracted entities
+    Initialize the tool-bound supervisor P-LLM.
 
-    Acts as Alex, the MAFC sales agent who:
-    1. Focuses on lead generation and sales by default
-    2. Routes to specialists ONLY for technical support or billing issues
-    3. Always asks about customer status (new vs existing) to get tickets/history
-    4. Maintains natural conversation flow while capturing leads
+    The client and tool binding are built once per process and reused on every turn.
     """
-    messages = state["messages"]
-
-    # CRITICAL: Get structured intent from Q-LLM (NEVER access raw user input)
-    structured_intent = state.get("structured_intent", {})
-
-    if not structured_intent:
-        # Fallback: should not happen in normal flow
-        return state
-
-    # Extract safe, sanitized data from Q-LLM
-    intent = structured_intent.get("intent", "general")
-    safe_summary = structured_intent.get("summary", "")
-    entities = structured_intent.get("entities", {})
-    confidence = structured_intent.get("confidence", 0.5)
-
-    # P-LLM (Privileged LLM with tool access)
     if settings.USE_BEDROCK:
         # Production: Use Bedrock Claude Sonnet (powerful)
         from src.integrations.aws.bedrock_llm import get_sonnet_llm
@@ -63,44 +42,12 @@ async def supervisor_agent_node(state: ConversationState) -> ConversationState:
         )
         logger.info("P-LLM Supervisor initialized with OpenAI GPT-4")
 
-    supervisor_llm = supervisor_llm.bind_tools(awesome_company_tools)
-
-    client_already_identified = state.get("is_existing_client") is not None
-
-    # Use Q-LLM's intent classification for routing
-    # Q-LLM already classified as: support|sales|billing|general
-    needs_specialist_routing = intent in ["support", "billing"]
-    specialist_type = intent.upper() if needs_specialist_routing else None
-
-    if needs_specialist_routing and specialist_type:
-        route_to = "support" if specialist_type == "SUPPORT" else "billing"
-        return {**state, "route_to": route_to, "current_persona": route_to}
+    return supervisor_llm.bind_tools(awesome_company_tools)
 
-    # CRITICAL: Create safe message list for P-LLM
-    # Replace last user message with Q-LLM's safe summary
-    safe_messages = messages[:-1].copy() if messages else []
-
-    # Add Q-LLM's sanitized summary as the "user" message P-LLM sees
-    safe_user_message = HumanMessage(content=safe_summary)
-    safe_messages.append(safe_user_message)
-
-    # Add context from extracted entities
-    entity_context = ""
-    if entities:
-        entity_parts = []
-        if "issue_type" in entities:
-            entity_parts.append(f"Issue: {entities['issue_type']}")
-        if "plan_interest" in entities:
-            entity_parts.append(f"Plan Interest: {entities['plan_interest']}")
-        if "urgency" in entities:
-            entity_parts.append(f"Urgency: {entities['urgency']}")
-        if entity_parts:
-            entity_context = f"\n\n**Context from intent analysis:** {', '.join(entity_parts)}"
 
-    if not client_already_identified:
-        sales_conversation_prompt = f"""You are Alex, MAFC's primary sales representative and lead generator.
+NEW_CUSTOMER_SALES_PROMPT = """You are Alex, MAFC's primary sales representative and lead generator.
 
-**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.{entity_context}
+**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.
 
 **CORE MISSION: EVERY CONVERSATION IS A SALES OPPORTUNITY**
 
@@ -146,10 +93,11 @@ async def supervisor_agent_node(state: ConversationState) -> ConversationState:
 - Always work toward getting contact information
 
 **KEY PRINCIPLE:** You're not just customer support - you're a sales professional. Every interaction should move toward lead generation or account growth."""
-    else:
-        sales_conversation_prompt = f"""You are Alex, MAFC's sales representative focused on account growth and customer satisfaction.
 
-**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.{entity_context}
+
+EXISTING_CUSTOMER_SALES_PROMPT = """You are Alex, MAFC's sales representative focused on account growth and customer satisfaction.
+
+**SECURITY NOTE:** You are processing pre-analyzed customer intent. Work with the provided summary.
 
 **CUSTOMER IDENTIFIED - FOCUS ON ACCOUNT OPTIMIZATION:**
 
@@ -168,6 +116,77 @@ Guidelines:
 
 Your goal: Maximize customer satisfaction while identifying growth opportunities."""
 
+
+async def supervisor_agent_node(state: ConversationState) -> ConversationState:
+    """
+    P-LLM Supervisor Agent (Privileged LLM with tool access).
+
+    CRITICAL SECURITY PRINCIPLE:
+    - This P-LLM NEVER sees raw user input
+    - Only processes structured intent from Q-LLM
+    - Works with sanitized summary and extracted entities
+
+    Acts as Alex, the MAFC sales agent who:
+    1. Focuses on lead generation and sales by default
+    2. Routes to specialists ONLY for technical support or billing issues
+    3. Always asks about customer status (new vs existing) to get tickets/history
+    4. Maintains natural conversation flow while capturing leads
+    """
+    messages = state["messages"]
+
+    # CRITICAL: Get structured intent from Q-LLM (NEVER access raw user input)
+    structured_intent = state.get("structured_intent", {})
+
+    if not structured_intent:
+        # Fallback: should not happen in normal flow
+        return state
+
+    # Extract safe, sanitized data from Q-LLM
+    intent = structured_intent.get("intent", "general")
+    safe_summary = structured_intent.get("summary", "")
+    entities = structured_intent.get("entities", {})
+    confidence = structured_intent.get("confidence", 0.5)
+
+    client_already_identified = state.get("is_existing_client") is not None
+
+    # Use Q-LLM's intent classification for routing
+    # Q-LLM already classified as: support|sales|billing|general
+    needs_specialist_routing = intent in ["support", "billing"]
+    specialist_type = intent.upper() if needs_specialist_routing else None
+
+    # Specialist routes are decided here without a P-LLM call, so the
+    # specialist node is the only LLM hop on these turns.
+    if needs_specialist_routing and specialist_type:
+        route_to = "support" if specialist_type == "SUPPORT" else "billing"
+        return {**state, "route_to": route_to, "current_persona": route_to}
+
+    # Add context from extracted entities
+    entity_context = ""
+    if entities:
+        entity_parts = []
+        if "issue_type" in entities:
+            entity_parts.append(f"Issue: {entities['issue_type']}")
+        if "plan_interest" in entities:
+            entity_parts.append(f"Plan Interest: {entities['plan_interest']}")
+        if "urgency" in entities:
+            entity_parts.append(f"Urgency: {entities['urgency']}")
+        if entity_parts:
+            entity_context = f"\n\n**Context from intent analysis:** {', '.join(entity_parts)}"
+
+    # CRITICAL: Create safe message list for P-LLM
+    # Replace last user message with Q-LLM's safe summary. Intent data goes
+    # last so the static system prompt stays a cacheable prompt prefix.
+    safe_messages = trim_history(messages[:-1])
+    safe_user_message = HumanMessage(content=safe_summary + entity_context)
+    safe_messages.append(safe_user_message)
+
+    if not client_already_identified:
+        sales_conversation_prompt = NEW_CUSTOMER_SALES_PROMPT
+    else:
+        sales_conversation_prompt = EXISTING_CUSTOMER_SALES_PROMPT
+
+    supervisor_llm = get_supervisor_llm()
+
     try:
         # P-LLM processes ONLY safe messages (never raw user input)
         response = await supervisor_llm.ainvoke(
@@ -13,11 +13,13 @@ This provides ARCHITECTURAL guarantee (not probabilistic filtering).
 from typing import Dict, Any, Optional
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from pydantic import BaseModel, Field
-import json
+import orjson
 
 from src.integrations.zendesk.langgraph_agent.state.conversation_state import (
     ConversationState,
 )
+from src.integrations.zendesk.langgraph_agent.utils.intent_cache import IntentCache
+from src.integrations.zendesk.langgraph_agent.utils.message_history import trim_history
 from src.core.config import settings
 from src.core.logging_config import get_logger
 
@@ -116,12 +118,13 @@ class IntentExtractor:
     """Q-LLM intent extractor (no tool access)."""
 
     def __init__(self):
+        self.cache = IntentCache()
+
         # Use fast, cheap model for intent extraction (Q-LLM)
         if settings.USE_BEDROCK:
             # Production: Use Bedrock Claude Haiku (fast, cheap)
             from src.integrations.aws.bedrock_llm import get_haiku_llm
             self.q_llm = get_haiku_llm(temperature=0.0, max_tokens=300)
-            self.cache = None
             logger.info("Q-LLM initialized with Bedrock Claude Haiku")
         else:
             # Development: Use OpenAI GPT-3.5
@@ -133,7 +136,6 @@ class IntentExtractor:
                 temperature=0.0,
                 max_tokens=300,
             )
-            self.cache = None
             logger.info("Q-LLM initialized with OpenAI GPT-3.5")
 
     async def extract_intent(
@@ -164,7 +166,7 @@ class IntentExtractor:
             }
         )
 
-        # Try cache first (production only)
+        # Try cache first
         if self.cache:
             cached_intent = await self.cache.get(user_message, conversation_context)
             if cached_intent:
@@ -210,7 +212,7 @@ class IntentExtractor:
             response_text = response_text.strip()
 
             # Parse and validate
-            intent_data = json.loads(response_text)
+            intent_data = orjson.loads(response_text)
             structured_intent = StructuredIntent(**intent_data)
 
             logger.info(
@@ -223,7 +225,7 @@ class IntentExtractor:
                 }
             )
 
-            # Cache result for future queries (production only)
+            # Cache result for future queries
             if self.cache:
                 await self.cache.set(
                     user_message,
@@ -233,7 +235,7 @@ class IntentExtractor:
 
             return structured_intent
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Q-LLM returned invalid JSON: {response.content}")
             # Fallback: treat as suspicious
             return StructuredIntent(
@@ -295,7 +297,7 @@ async def intent_extraction_node(state: ConversationState) -> ConversationState:
 
     # Build conversation context (for Q-LLM)
     conversation_context = ""
-    for msg in messages[:-1]:
+    for msg in trim_history(messages[:-1]):
         if isinstance(msg, HumanMessage):
             conversation_context += f"User: {msg.content[:200]}\n"
         elif isinstance(msg, AIMessage):
@@ -316,6 +318,10 @@ async def intent_extraction_node(state: ConversationState) -> ConversationState:
         conversation_context=conversation_context
     )
 
+    # Dict-shaped intents are validated too, so unchecked data never reaches the P-LLM
+    if not isinstance(structured_intent, StructuredIntent):
+        structured_intent = StructuredIntent.model_validate(structured_intent)
+
     # Determine if should be blocked
     is_blocked = structured_intent.safety_assessment == "attack"
 
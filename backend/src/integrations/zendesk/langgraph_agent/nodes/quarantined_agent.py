@@ -11,6 +11,8 @@ Key Security Properties:
 - Used when trust_level < VERIFIED
 """
 
+from functools import lru_cache
+
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
@@ -27,8 +29,13 @@ logger = get_logger("quarantined_agent")
 
 
 # Quarantined LLM with NO tool access (Q-LLM)
+@lru_cache(maxsize=1)
 def get_quarantined_llm():
-    """Initialize quarantined LLM (Q-LLM pattern - no tool access)."""
+    """
+    Initialize quarantined LLM (Q-LLM pattern - no tool access).
+
+    The client is built once per process and reused on every quarantined turn.
+    """
     if settings.USE_BEDROCK:
         # Production: Use Bedrock Claude Haiku (fast, cheap, no tools)
         from src.integrations.aws.bedrock_llm import get_haiku_llm
@@ -4,6 +4,59 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 from typing import Dict, Any, List
 
+from src.integrations.zendesk.langgraph_agent.nodes.billing_agent import get_billing_llm
+from src.integrations.zendesk.langgraph_agent.nodes.conversation_router import get_supervisor_llm
+from src.integrations.zendesk.langgraph_agent.nodes.quarantined_agent import get_quarantined_llm
+from src.integrations.zendesk.langgraph_agent.nodes.sales_agent import get_sales_llm
+from src.integrations.zendesk.langgraph_agent.nodes.support_agent import get_support_llm
+
+
+_BASE_STATE = {"current_persona": "unknown", "security_blocked": False}
+
+
+_CACHED_LLM_GETTERS = (
+    get_billing_llm,
+    get_quarantined_llm,
+    get_sales_llm,
+    get_supervisor_llm,
+    get_support_llm,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_caches():
+    """Reset the memoized LLM clients so each test sees its own patches."""
+    for getter in _CACHED_LLM_GETTERS:
+        getter.cache_clear()
+    yield
+    for getter in _CACHED_LLM_GETTERS:
+        getter.cache_clear()
+
+
+@pytest.fixture
+def make_state():
+    """Helper to build a conversation state from the shared base."""
+    def _create(messages: List[Any], **overrides):
+        """Create a state with the given messages and any overridden keys."""
+        state = _BASE_STATE.copy()
+        state["messages"] = messages
+        state.update(overrides)
+        return state
+    return _create
+
+
+@pytest.fixture
+def async_return():
+    """Helper to create a bare coroutine function with a fixed return value.
+
+    Use instead of AsyncMock when the test never inspects the calls.
+    """
+    def _create(value: Any):
+        async def _fake(*args, **kwargs):
+            return value
+        return _fake
+    return _create
+
 
 @pytest.fixture
 def mock_q_llm_response():
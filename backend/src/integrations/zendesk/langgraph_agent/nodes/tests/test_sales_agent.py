@@ -6,9 +6,12 @@ and creates sales tickets when appropriate.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
-from src.integrations.zendesk.langgraph_agent.nodes.sales_agent import sales_agent_node
+from src.integrations.zendesk.langgraph_agent.nodes.sales_agent import (
+    sales_agent_node,
+    SALES_SYSTEM_PROMPT,
+)
 
 
 @pytest.mark.unit
@@ -72,6 +75,26 @@ class TestSalesAgentToolUsage:
                 assert dangerous_input not in messages_str
                 assert "pricing information" in messages_str or "summary" in messages_str.lower()
 
+    async def test_sales_agent_puts_intent_after_static_prompt(self, sample_sales_intent_state):
+        """Test static system prompt comes first and intent data comes last (prompt caching)."""
+        state = sample_sales_intent_state.copy()
+        state["structured_intent"]["summary"] = "Customer wants gigabit pricing"
+        state["structured_intent"]["entities"] = {"plan_interest": "gigabit"}
+
+        with patch('src.integrations.zendesk.langgraph_agent.nodes.sales_agent.ChatOpenAI') as MockChatOpenAI:
+            mock_llm = MockChatOpenAI.return_value
+            mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+            mock_llm.ainvoke = AsyncMock(return_value=AIMessage(content="Here are our plans"))
+
+            await sales_agent_node(state)
+
+            llm_messages = mock_llm.ainvoke.call_args[0][0]
+            assert isinstance(llm_messages[0], SystemMessage)
+            assert llm_messages[0].content == SALES_SYSTEM_PROMPT
+            assert isinstance(llm_messages[-1], HumanMessage)
+            assert llm_messages[-1].content.startswith("Customer wants gigabit pricing")
+            assert "Plan Interest: gigabit" in llm_messages[-1].content
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -7,7 +7,14 @@ from langchain_core.messages import BaseMessage
 
 
 class ConversationState(TypedDict):
-    """State object for MyAwesomeFakeCompany customer support workflow."""
+    """
+    State object for MyAwesomeFakeCompany customer support workflow.
+
+    Kept as a TypedDict rather than a slots dataclass: every node reads the
+    state as a mapping (state["messages"], state.get(...)) and returns a
+    partial dict that LangGraph merges per channel, so the graph never holds
+    one long-lived state object whose layout would benefit from __slots__.
+    """
 
     messages: Annotated[list[BaseMessage], add_messages]
 
@@ -6,126 +6,177 @@ plan information, and sales assistance.
 """
 
 import os
+import re
 from pathlib import Path
 from typing import List, Dict, Any
 from langchain_core.tools import tool
 
 from .knowledge_utils import (
+    EXTRACTION_ERROR_PREFIXES,
     extract_pdf_content_chunked,
     extract_text_content_chunked,
     get_knowledge_file_path,
 )
+from .zendesk_tools import zendesk_tools_clean
 
 
-@tool
-def get_awesome_company_plans_pricing() -> str:
-    """
-    Get MyAwesomeFakeCompany plans and pricing information for customer inquiries.
+# Keyword routing for search/troubleshooting queries (substring match on lowercased input)
+_PLAN_QUERY_RE = re.compile("plan|price|pricing|cost|package|service")
+_COMPANY_QUERY_RE = re.compile("company|about|myawesomefakecompany|background|story")
+_FAQ_QUERY_RE = re.compile("faq|question|help|support|how to")
 
-    Use this tool when customers ask about:
-    - Internet plans and speeds
-    - Pricing and costs
-    - Available packages
-    - Bundle options
-    - Promotional offers
+# Tool responses wrap knowledge base content in constant guidance text, built once
+_PLANS_TEMPLATE = """MyAwesomeFakeCompany Plans and Pricing Information:
 
-    Returns:
-        Current MyAwesomeFakeCompany plans and pricing information from the knowledge base.
-    """
+{content}
+
+SALES GUIDANCE: Present 2-3 specific plans, mention promotions, ask qualifying questions, create urgency, guide to signup.
+GENERAL GUIDANCE: Provide overview only, route detailed sales questions to Sales specialist."""
+
+_PLANS_UNAVAILABLE = "Unable to access current MyAwesomeFakeCompany plans and pricing. Please contact our sales team at 1-800-AWESOME-COMPANY for the latest information."
+
+_MOBILE_PLANS_UNAVAILABLE = "Mobile plans information not available in current knowledge base. Please contact our sales team at 1-800-AWESOME-COMPANY for mobile plan details."
+
+_COMPANY_TEMPLATE = """MyAwesomeFakeCompany Company Information:
+
+{content}
+
+Use this information conversationally to share relevant details about company background, mission, service areas, and what makes MyAwesomeFakeCompany different."""
+
+_COMPANY_FALLBACK = """MyAwesomeFakeCompany Company Information:
+
+MyAwesomeFakeCompany is a customer-focused telecommunications company founded in 2018, headquartered in Austin, Texas. We're committed to bridging the digital divide with reliable, affordable connectivity across 15 states and growing.
+
+For more detailed company information, please contact us at 1-800-AWESOME-COMPANY."""
+
+_FAQ_TEMPLATE = "# MyAwesomeFakeCompany FAQ\n\n{content}"
+
+_FAQ_UNAVAILABLE = "MyAwesomeFakeCompany FAQ not available at this time. Please contact support at 1-800-AWESOME-COMPANY for assistance."
+
+_SPEED_GUIDE_TEMPLATE = """Internet Speed Troubleshooting Guide:
+
+{content}
+
+SUPPORT GUIDANCE: Walk customer through testing steps, ask about WiFi/ethernet, device count, provide step-by-step guidance. Create ticket if issue persists."""
+
+_SPEED_GUIDE_UNAVAILABLE = "Internet speed guide not available. Please contact technical support at 1-800-TECH-AWESOME for speed troubleshooting assistance."
+
+_ROUTER_GUIDE_TEMPLATE = """Router Configuration Troubleshooting Guide:
+
+{content}
+
+SUPPORT GUIDANCE: Ask about router type, lights/colors, power cycle attempts, other device connectivity. Walk through reset steps and configuration. Create ticket if issue persists."""
+
+_ROUTER_GUIDE_UNAVAILABLE = "Router configuration guide not available. Please contact technical support at 1-800-TECH-AWESOME for router assistance."
+
+
+def _get_awesome_company_plans_pricing_impl() -> str:
+    """Build the plans and pricing response from the knowledge base."""
     try:
         plans_files = [
             "MyAwesomeFakeCompany Plans and Services - Complete Guide.pdf",
             "Updated Pricing and Products Table - Agent Reference.pdf",
         ]
 
-        plans_content = ""
+        plans_parts = []
 
         for filename in plans_files:
             file_path = get_knowledge_file_path(filename)
             file_content = extract_pdf_content_chunked(file_path, max_chars=500)
-            if (
-                "Error reading" not in file_content
-                and "File not found" not in file_content
-            ):
-                plans_content += f"From {filename}:\n{file_content}\n\n"
+            if not file_content.startswith(EXTRACTION_ERROR_PREFIXES):
+                plans_parts.append(f"From {filename}:\n{file_content}\n\n")
 
-        if plans_content:
-            return f"""MyAwesomeFakeCompany Plans and Pricing Information:
-
-{plans_content}
+        plans_content = "".join(plans_parts)
 
-SALES GUIDANCE: Present 2-3 specific plans, mention promotions, ask qualifying questions, create urgency, guide to signup.
-GENERAL GUIDANCE: Provide overview only, route detailed sales questions to Sales specialist."""
+        if plans_content:
+            return _PLANS_TEMPLATE.format(content=plans_content)
 
         else:
-            return "Unable to access current MyAwesomeFakeCompany plans and pricing. Please contact our sales team at 1-800-AWESOME-COMPANY for the latest information."
+            return _PLANS_UNAVAILABLE
 
     except Exception as e:
         return f"Error accessing MyAwesomeFakeCompany plans: {str(e)}. Please contact our sales team at 1-800-AWESOME-COMPANY for assistance."
 
 
 @tool
-def get_awesome_company_company_info() -> str:
+def get_awesome_company_plans_pricing() -> str:
     """
-    Get MyAwesomeFakeCompany company background and story for customer inquiries.
+    Get MyAwesomeFakeCompany plans and pricing information for customer inquiries.
 
     Use this tool when customers ask about:
-    - Company history and background
-    - MyAwesomeFakeCompany's mission and values
-    - Coverage areas and locations
-    - Company achievements and awards
+    - Internet plans and speeds
+    - Pricing and costs
+    - Available packages
+    - Bundle options
+    - Promotional offers
 
     Returns:
-        MyAwesomeFakeCompany company information from the knowledge base.
+        Current MyAwesomeFakeCompany plans and pricing information from the knowledge base.
     """
+    return _get_awesome_company_plans_pricing_impl()
+
+
+def _get_awesome_company_company_info_impl() -> str:
+    """Build the company background response from the knowledge base."""
     try:
         company_file = get_knowledge_file_path("MyAwesomeFakeCompany Company Story.txt")
         company_content = extract_text_content_chunked(company_file, max_chars=500)
 
-        if (
-            "Error reading" not in company_content
-            and "File not found" not in company_content
-        ):
-            return f"""MyAwesomeFakeCompany Company Information:
-
-{company_content}
-
-Use this information conversationally to share relevant details about company background, mission, service areas, and what makes MyAwesomeFakeCompany different."""
+        if not company_content.startswith(EXTRACTION_ERROR_PREFIXES):
+            return _COMPANY_TEMPLATE.format(content=company_content)
 
         else:
-            return """MyAwesomeFakeCompany Company Information:
-
-MyAwesomeFakeCompany is a customer-focused telecommunications company founded in 2018, headquartered in Austin, Texas. We're committed to bridging the digital divide with reliable, affordable connectivity across 15 states and growing.
-
-For more detailed company information, please contact us at 1-800-AWESOME-COMPANY."""
+            return _COMPANY_FALLBACK
 
     except Exception as e:
         return f"Error accessing MyAwesomeFakeCompany company information: {str(e)}. Please contact us at 1-800-AWESOME-COMPANY for more details about our company."
 
 
 @tool
-def get_awesome_company_faq() -> str:
+def get_awesome_company_company_info() -> str:
     """
-    Get MyAwesomeFakeCompany frequently asked questions and support information.
+    Get MyAwesomeFakeCompany company background and story for customer inquiries.
+
+    Use this tool when customers ask about:
+    - Company history and background
+    - MyAwesomeFakeCompany's mission and values
+    - Coverage areas and locations
+    - Company achievements and awards
 
     Returns:
-        String containing MyAwesomeFakeCompany FAQ and common support topics.
+        MyAwesomeFakeCompany company information from the knowledge base.
     """
+    return _get_awesome_company_company_info_impl()
+
+
+def _get_awesome_company_faq_impl() -> str:
+    """Build the FAQ response from the knowledge base."""
     try:
         faq_file = get_knowledge_file_path(
             "MyAwesomeFakeCompany Frequently Asked Questions (FAQ).pdf", subfolder="FAQ"
         )
         faq_content = extract_pdf_content_chunked(faq_file, max_chars=500)
 
-        if "Error reading" not in faq_content and "File not found" not in faq_content:
-            return f"# MyAwesomeFakeCompany FAQ\n\n{faq_content}"
+        if not faq_content.startswith(EXTRACTION_ERROR_PREFIXES):
+            return _FAQ_TEMPLATE.format(content=faq_content)
         else:
-            return "MyAwesomeFakeCompany FAQ not available at this time. Please contact support at 1-800-AWESOME-COMPANY for assistance."
+            return _FAQ_UNAVAILABLE
 
     except Exception as e:
         return f"Error accessing MyAwesomeFakeCompany FAQ: {str(e)}"
 
 
+@tool
+def get_awesome_company_faq() -> str:
+    """
+    Get MyAwesomeFakeCompany frequently asked questions and support information.
+
+    Returns:
+        String containing MyAwesomeFakeCompany FAQ and common support topics.
+    """
+    return _get_awesome_company_faq_impl()
+
+
 @tool
 def search_awesome_company_knowledge(query: str) -> str:
     """
@@ -140,23 +191,14 @@ def search_awesome_company_knowledge(query: str) -> str:
     try:
         query_lower = query.lower()
 
-        if any(
-            term in query_lower
-            for term in ["plan", "price", "pricing", "cost", "package", "service"]
-        ):
-            return get_awesome_company_plans_pricing.invoke({})
-        elif any(
-            term in query_lower
-            for term in ["company", "about", "myawesomefakecompany", "background", "story"]
-        ):
-            return get_awesome_company_company_info.invoke({})
-        elif any(
-            term in query_lower
-            for term in ["faq", "question", "help", "support", "how to"]
-        ):
-            return get_awesome_company_faq.invoke({})
+        if _PLAN_QUERY_RE.search(query_lower):
+            return _get_awesome_company_plans_pricing_impl()
+        elif _COMPANY_QUERY_RE.search(query_lower):
+            return _get_awesome_company_company_info_impl()
+        elif _FAQ_QUERY_RE.search(query_lower):
+            return _get_awesome_company_faq_impl()
         else:
-            return get_awesome_company_plans_pricing.invoke({})
+            return _get_awesome_company_plans_pricing_impl()
 
     except Exception as e:
         return f"Error searching MyAwesomeFakeCompany knowledge base: {str(e)}"
@@ -174,7 +216,7 @@ def get_plan_comparison(plan_type: str = "internet") -> str:
         String containing plan comparison information.
     """
     try:
-        plans_info = get_awesome_company_plans_pricing.invoke({})
+        plans_info = _get_awesome_company_plans_pricing_impl()
         plan_type_lower = plan_type.lower()
         comparison_intro = f"# MyAwesomeFakeCompany {plan_type.title()} Plan Comparison\n\n"
 
@@ -182,7 +224,7 @@ def get_plan_comparison(plan_type: str = "internet") -> str:
             if "mobile" in plans_info.lower() or "phone" in plans_info.lower():
                 return comparison_intro + plans_info
             else:
-                return f"# MyAwesomeFakeCompany {plan_type.title()} Plan Comparison\n\nMobile plans information not available in current knowledge base. Please contact our sales team at 1-800-AWESOME-COMPANY for mobile plan details."
+                return comparison_intro + _MOBILE_PLANS_UNAVAILABLE
         else:
             return comparison_intro + plans_info
 
@@ -190,6 +232,26 @@ def get_plan_comparison(plan_type: str = "internet") -> str:
         return f"Error getting plan comparison for {plan_type}: {str(e)}"
 
 
+def _get_internet_speed_guide_impl() -> str:
+    """Build the internet speed troubleshooting response from the knowledge base."""
+    try:
+        speed_guide_file = get_knowledge_file_path(
+            "How to Check Your Internet Speed - Complete Guide.pdf"
+        )
+        speed_guide_content = extract_pdf_content_chunked(
+            speed_guide_file, max_chars=500
+        )
+
+        if not speed_guide_content.startswith(EXTRACTION_ERROR_PREFIXES):
+            return _SPEED_GUIDE_TEMPLATE.format(content=speed_guide_content)
+
+        else:
+            return _SPEED_GUIDE_UNAVAILABLE
+
+    except Exception as e:
+        return f"Error accessing internet speed guide: {str(e)}. Please contact technical support at 1-800-TECH-AWESOME."
+
+
 @tool
 def get_internet_speed_guide() -> str:
     """
@@ -204,29 +266,27 @@ def get_internet_speed_guide() -> str:
     Returns:
         Complete guide for internet speed testing and troubleshooting.
     """
+    return _get_internet_speed_guide_impl()
+
+
+def _get_router_configuration_guide_impl() -> str:
+    """Build the router configuration response from the knowledge base."""
     try:
-        speed_guide_file = get_knowledge_file_path(
-            "How to Check Your Internet Speed - Complete Guide.pdf"
+        router_guide_file = get_knowledge_file_path(
+            "How to Configure Your Router - Complete Guide.pdf"
         )
-        speed_guide_content = extract_pdf_content_chunked(
-            speed_guide_file, max_chars=500
+        router_guide_content = extract_pdf_content_chunked(
+            router_guide_file, max_chars=500
         )
 
-        if (
-            "Error reading" not in speed_guide_content
-            and "File not found" not in speed_guide_content
-        ):
-            return f"""Internet Speed Troubleshooting Guide:
-
-{speed_guide_content}
-
-SUPPORT GUIDANCE: Walk customer through testing steps, ask about WiFi/ethernet, device count, provide step-by-step guidance. Create ticket if issue persists."""
+        if not router_guide_content.startswith(EXTRACTION_ERROR_PREFIXES):
+            return _ROUTER_GUIDE_TEMPLATE.format(content=router_guide_content)
 
         else:
-            return "Internet speed guide not available. Please contact technical support at 1-800-TECH-AWESOME for speed troubleshooting assistance."
+            return _ROUTER_GUIDE_UNAVAILABLE
 
     except Exception as e:
-        return f"Error accessing internet speed guide: {str(e)}. Please contact technical support at 1-800-TECH-AWESOME."
+        return f"Error accessing router configuration guide: {str(e)}. Please contact technical support at 1-800-TECH-AWESOME."
 
 
 @tool
@@ -243,29 +303,16 @@ def get_router_configuration_guide() -> str:
     Returns:
         Complete guide for router configuration and troubleshooting.
     """
-    try:
-        router_guide_file = get_knowledge_file_path(
-            "How to Configure Your Router - Complete Guide.pdf"
-        )
-        router_guide_content = extract_pdf_content_chunked(
-            router_guide_file, max_chars=500
-        )
-
-        if (
-            "Error reading" not in router_guide_content
-            and "File not found" not in router_guide_content
-        ):
-            return f"""Router Configuration Troubleshooting Guide:
-
-{router_guide_content}
-
-SUPPORT GUIDANCE: Ask about router type, lights/colors, power cycle attempts, other device connectivity. Walk through reset steps and configuration. Create ticket if issue persists."""
+    return _get_router_configuration_guide_impl()
 
-        else:
-            return "Router configuration guide not available. Please contact technical support at 1-800-TECH-AWESOME for router assistance."
 
-    except Exception as e:
-        return f"Error accessing router configuration guide: {str(e)}. Please contact technical support at 1-800-TECH-AWESOME."
+# Issue keyword -> guide builder, checked in order (first match wins)
+_ISSUE_ROUTES = (
+    ("speed", _get_internet_speed_guide_impl),
+    ("router", _get_router_configuration_guide_impl),
+    ("wifi", _get_router_configuration_guide_impl),
+    ("connection", _get_router_configuration_guide_impl),
+)
 
 
 @tool
@@ -282,21 +329,19 @@ def get_technical_troubleshooting_steps(issue_type: str) -> str:
     try:
         issue_type_lower = issue_type.lower()
 
-        if "speed" in issue_type_lower:
-            return get_internet_speed_guide.invoke({})
-        elif any(term in issue_type_lower for term in ["router", "wifi", "connection"]):
-            return get_router_configuration_guide.invoke({})
-        else:
-            # Get general FAQ for other issues
-            return get_awesome_company_faq.invoke({})
+        for keyword, get_guide in _ISSUE_ROUTES:
+            if keyword in issue_type_lower:
+                return get_guide()
+
+        # Get general FAQ for other issues
+        return _get_awesome_company_faq_impl()
 
     except Exception as e:
         return f"Error getting troubleshooting steps: {str(e)}. Please contact technical support at 1-800-TECH-AWESOME."
 
 
-from .zendesk_tools import zendesk_tools_clean
-
-awesome_company_tools = [
+# Read-only: bound to every agent LLM and shared across the process
+awesome_company_tools = (
     get_awesome_company_plans_pricing,
     get_awesome_company_company_info,
     get_awesome_company_faq,
@@ -305,4 +350,5 @@ awesome_company_tools = [
     get_internet_speed_guide,
     get_router_configuration_guide,
     get_technical_troubleshooting_steps,
-] + zendesk_tools_clean
+    *zendesk_tools_clean,
+)
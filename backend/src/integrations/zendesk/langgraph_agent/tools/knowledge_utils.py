@@ -3,16 +3,84 @@ Reusable utilities for knowledge base content extraction and chunking.
 Uses LangChain's document processing and chunking capabilities.
 """
 
+import asyncio
+import hashlib
+import heapq
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
+from typing import List, Optional, Tuple, Union
+import ahocorasick
+import orjson
+from langchain_community.document_loaders import TextLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.docstore.document import Document
 
 
+# Root folder of the static knowledge base files
+KNOWLEDGE_BASE_DIR = Path("myawesomefakecompanyBaseKnowledge")
+
+# Extraction failures are reported as messages starting with one of these
+EXTRACTION_ERROR_PREFIXES = ("Error reading", "File not found")
+
+# On-disk cache of splitter output, keyed by file content hash and chunking params
+KNOWLEDGE_CACHE_DIR = Path(".cache/knowledge")
+
+# Part of every cache file name; bump when the parser or splitter output changes
+KNOWLEDGE_CACHE_VERSION = "pdfium1"
+
+# Terms that mark a chunk as relevant to plans, pricing and service questions
+_KEY_TERMS = (
+    "plan",
+    "price",
+    "pricing",
+    "cost",
+    "$",
+    "month",
+    "year",
+    "internet",
+    "service",
+    "package",
+    "residential",
+    "business",
+    "premium",
+    "unlimited",
+    "promotion",
+    "offer",
+    "installation",
+    "mobile",
+    "phone",
+    "speed",
+    "mbps",
+    "gbps",
+    "fiber",
+    "wifi",
+    "router",
+)
+
+
+def _build_key_term_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton matching every key term in one pass."""
+    automaton = ahocorasick.Automaton()
+    for term in _KEY_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once; counting all key terms in a lowercased chunk is a single C-level pass
+_KEY_TERM_AUTOMATON = _build_key_term_automaton()
+
+# Compiled once so the bonus checks are a single case-insensitive pass each
+_BILLING_PERIOD_RE = re.compile("month|year", re.IGNORECASE)
+_PLAN_WORD_RE = re.compile("plan|package|service", re.IGNORECASE)
+
+
 def extract_pdf_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
     """
-    Extract PDF content using LangChain's PyPDFLoader and text splitter.
+    Extract PDF content using PDFium and LangChain's text splitter.
+
+    Results are cached per file version, so repeated calls skip parsing and scoring.
 
     Args:
         file_path: Path to the PDF file
@@ -25,31 +93,18 @@ def extract_pdf_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
         if not file_path.exists():
             return f"File not found: {file_path.name}"
 
-        loader = PyPDFLoader(str(file_path))
-        documents = loader.load()
-
-        if not documents:
-            return f"No content extracted from {file_path.name}"
-
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=max_chars,
-            chunk_overlap=200,  # 200 char overlap for context preservation
-            length_function=len,
-            separators=[
-                "\n\n",
-                "\n",
-                ". ",
-                " ",
-                "",
-            ],  # Prioritize paragraph/sentence breaks
+        content = _extract_relevant(
+            str(file_path),
+            file_path.stat().st_mtime_ns,
+            max_chars,
+            200,  # 200 char overlap for context preservation
+            "pdf",
         )
 
-        all_chunks = []
-        for doc in documents:
-            chunks = text_splitter.split_text(doc.page_content)
-            all_chunks.extend(chunks)
+        if content is None:
+            return f"No content extracted from {file_path.name}"
 
-        return _select_relevant_chunks(all_chunks, max_chars)
+        return content
 
     except Exception as e:
         return f"Error reading {file_path.name}: {str(e)}"
@@ -59,6 +114,8 @@ def extract_text_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
     """
     Extract text file content using LangChain's TextLoader and text splitter.
 
+    Results are cached per file version, so repeated calls skip parsing and scoring.
+
     Args:
         file_path: Path to the text file
         max_chars: Maximum characters to return
@@ -70,28 +127,260 @@ def extract_text_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
         if not file_path.exists():
             return f"File not found: {file_path.name}"
 
-        loader = TextLoader(str(file_path), encoding="utf-8")
-        documents = loader.load()
+        content = _extract_relevant(
+            str(file_path), file_path.stat().st_mtime_ns, max_chars, 100, "text"
+        )
 
-        if not documents:
+        if content is None:
             return f"No content found in {file_path.name}"
 
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=max_chars,
-            chunk_overlap=100,
-            length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""],
+        return content
+
+    except Exception as e:
+        return f"Error reading {file_path.name}: {str(e)}"
+
+
+async def aextract_pdf_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
+    """
+    Async variant of extract_pdf_content_chunked.
+
+    Runs the extraction in a worker thread so PDF parsing never blocks the event loop.
+
+    Args:
+        file_path: Path to the PDF file
+        max_chars: Maximum characters to return (roughly 500 tokens)
+
+    Returns:
+        Chunked PDF content using LangChain
+    """
+    return await asyncio.to_thread(extract_pdf_content_chunked, file_path, max_chars)
+
+
+async def aextract_text_content_chunked(file_path: Path, max_chars: int = 2000) -> str:
+    """
+    Async variant of extract_text_content_chunked.
+
+    Runs the extraction in a worker thread so file loading never blocks the event loop.
+
+    Args:
+        file_path: Path to the text file
+        max_chars: Maximum characters to return
+
+    Returns:
+        Chunked text content using LangChain
+    """
+    return await asyncio.to_thread(extract_text_content_chunked, file_path, max_chars)
+
+
+async def aextract_many(file_paths: List[Path], max_chars: int = 2000) -> List[str]:
+    """
+    Extract several knowledge base files concurrently.
+
+    PDFs and text files are dispatched by suffix; each extraction runs in its own
+    worker thread, so disk and parsing work overlaps across files.
+
+    Args:
+        file_paths: Paths to PDF or text files
+        max_chars: Maximum characters to return per file
+
+    Returns:
+        Chunked content for each file, in the same order as file_paths
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                aextract_pdf_content_chunked(path, max_chars)
+                if path.suffix.lower() == ".pdf"
+                else aextract_text_content_chunked(path, max_chars)
+                for path in file_paths
+            )
         )
+    )
 
-        all_chunks = []
-        for doc in documents:
-            chunks = text_splitter.split_text(doc.page_content)
-            all_chunks.extend(chunks)
 
-        return _select_relevant_chunks(all_chunks, max_chars)
+async def preload_knowledge_base(max_chars: int = 500) -> int:
+    """
+    Parse every knowledge base file ahead of time so tool calls hit warm caches.
 
-    except Exception as e:
-        return f"Error reading {file_path.name}: {str(e)}"
+    Args:
+        max_chars: Chunk size to warm; matches what the knowledge tools request
+
+    Returns:
+        Number of files preloaded
+    """
+    file_paths = sorted(
+        path
+        for path in KNOWLEDGE_BASE_DIR.rglob("*")
+        if path.suffix.lower() in (".pdf", ".txt")
+    )
+    await aextract_many(file_paths, max_chars)
+    return len(file_paths)
+
+
+@lru_cache(maxsize=64)
+def _extract_relevant(
+    path_str: str, mtime_ns: int, max_chars: int, chunk_overlap: int, file_type: str
+) -> Optional[str]:
+    """
+    Select the relevant chunks of one version of a knowledge base file.
+
+    The knowledge base is static, so a warm tool call is a single dict lookup.
+
+    Args:
+        path_str: Path to the file
+        mtime_ns: File modification time, used to invalidate the cache
+        max_chars: Maximum characters to return
+        chunk_overlap: Overlap between consecutive chunks
+        file_type: "pdf" or "text", selects PDFium or LangChain's TextLoader
+
+    Returns:
+        Combined relevant chunks, or None if the file produced no pages
+    """
+    all_chunks = _load_and_split(path_str, mtime_ns, max_chars, chunk_overlap, file_type)
+
+    if all_chunks is None:
+        return None
+
+    return _select_relevant_chunks(list(all_chunks), max_chars)
+
+
+@lru_cache(maxsize=128)
+def _load_and_split(
+    path_str: str, mtime_ns: int, max_chars: int, chunk_overlap: int, file_type: str
+) -> Optional[Tuple[str, ...]]:
+    """
+    Load a knowledge base file and split it into chunks.
+
+    Cached on the file path and modification time, so edited files are re-parsed.
+    Misses fall back to the on-disk cache before parsing the file.
+
+    Args:
+        path_str: Path to the file
+        mtime_ns: File modification time, used to invalidate the cache
+        max_chars: Chunk size for the text splitter
+        chunk_overlap: Overlap between consecutive chunks
+        file_type: "pdf" or "text", selects PDFium or LangChain's TextLoader
+
+    Returns:
+        Tuple of chunks, or None if the file produced no pages
+    """
+    # Read once: the same bytes are hashed and, for PDFs, handed to the parser
+    file_bytes = Path(path_str).read_bytes()
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    cache_file = KNOWLEDGE_CACHE_DIR / (
+        f"{digest}-{KNOWLEDGE_CACHE_VERSION}-{max_chars}-{chunk_overlap}.json"
+    )
+
+    try:
+        return tuple(orjson.loads(cache_file.read_bytes()))
+    except (OSError, ValueError):
+        pass
+
+    all_chunks = _parse_and_split(
+        path_str, file_bytes, max_chars, chunk_overlap, file_type
+    )
+
+    if all_chunks is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(orjson.dumps(all_chunks))
+        except OSError:
+            # Disk cache is best-effort (e.g. read-only filesystem)
+            pass
+
+    return all_chunks
+
+
+def _parse_and_split(
+    path_str: str,
+    file_bytes: bytes,
+    max_chars: int,
+    chunk_overlap: int,
+    file_type: str,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a knowledge base file and split it into chunks.
+
+    Args:
+        path_str: Path to the file
+        file_bytes: Raw file contents, already read for hashing
+        max_chars: Chunk size for the text splitter
+        chunk_overlap: Overlap between consecutive chunks
+        file_type: "pdf" or "text", selects PDFium or LangChain's TextLoader
+
+    Returns:
+        Tuple of chunks, or None if the file produced no pages
+    """
+    if file_type == "pdf":
+        pages = _read_pdf_pages(file_bytes)
+    else:
+        loader = TextLoader(path_str, encoding="utf-8")
+        pages = [doc.page_content for doc in loader.load()]
+
+    if not pages:
+        return None
+
+    text_splitter = _get_splitter(max_chars, chunk_overlap)
+
+    all_chunks = []
+    for page_text in pages:
+        chunks = text_splitter.split_text(page_text)
+        all_chunks.extend(chunks)
+
+    return tuple(all_chunks)
+
+
+def _read_pdf_pages(source: Union[str, bytes]) -> List[str]:
+    """
+    Extract the text of each PDF page with PDFium (native, much faster than pypdf).
+
+    Args:
+        source: Path to the PDF file, or its raw bytes
+
+    Returns:
+        List of page texts, in page order
+    """
+    # Imported lazily: Lambda deployments exclude document processing packages
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        pages = []
+        for page in pdf:
+            text_page = page.get_textpage()
+            # PDFium separates lines with CRLF; normalize for the splitter
+            pages.append(text_page.get_text_range().replace("\r\n", "\n"))
+            text_page.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+@lru_cache(maxsize=8)
+def _get_splitter(max_chars: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """
+    Get a shared text splitter for the given chunking parameters.
+
+    Args:
+        max_chars: Chunk size for the text splitter
+        chunk_overlap: Overlap between consecutive chunks
+
+    Returns:
+        RecursiveCharacterTextSplitter reused across calls
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=max_chars,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=[
+            "\n\n",
+            "\n",
+            ". ",
+            " ",
+            "",
+        ],  # Prioritize paragraph/sentence breaks
+    )
 
 
 def _select_relevant_chunks(chunks: List[str], max_chars: int) -> str:
@@ -108,75 +397,58 @@ def _select_relevant_chunks(chunks: List[str], max_chars: int) -> str:
     if not chunks:
         return "No content available"
 
-    key_terms = [
-        "plan",
-        "price",
-        "pricing",
-        "cost",
-        "$",
-        "month",
-        "year",
-        "internet",
-        "service",
-        "package",
-        "residential",
-        "business",
-        "premium",
-        "unlimited",
-        "promotion",
-        "offer",
-        "installation",
-        "mobile",
-        "phone",
-        "speed",
-        "mbps",
-        "gbps",
-        "fiber",
-        "wifi",
-        "router",
-    ]
-
+    # Repeated page headers/footers yield identical chunks; score each once.
+    seen = set()
     scored_chunks = []
     for chunk in chunks:
-        score = 0
-        chunk_lower = chunk.lower()
+        if chunk in seen:
+            continue
+        seen.add(chunk)
 
-        for term in key_terms:
-            score += chunk_lower.count(term)
+        score = sum(1 for _ in _KEY_TERM_AUTOMATON.iter(chunk.lower()))
 
-        if "$" in chunk and ("month" in chunk_lower or "year" in chunk_lower):
+        if "$" in chunk and _BILLING_PERIOD_RE.search(chunk):
             score += 5
 
-        if any(word in chunk_lower for word in ["plan", "package", "service"]):
+        if _PLAN_WORD_RE.search(chunk):
             score += 3
 
         scored_chunks.append((score, chunk))
 
-    scored_chunks.sort(key=lambda x: x[0], reverse=True)
+    # The packing loop stops at the first chunk that does not fit, so at most
+    # max_chars // (shortest chunk + separator) chunks are ever used.
+    shortest = min(len(chunk) for _, chunk in scored_chunks)
+    max_keep = max_chars // (shortest + 7) + 1
+    top_chunks = heapq.nlargest(max_keep, scored_chunks, key=lambda x: x[0])
 
-    result = ""
+    selected = []
     current_length = 0
 
-    for score, chunk in scored_chunks:
+    for score, chunk in top_chunks:
         if current_length + len(chunk) + 10 <= max_chars:  # +10 for separator
-            if result:
-                result += "\n\n---\n\n"
+            if selected:
                 current_length += 7
-            result += chunk
+            selected.append(chunk)
             current_length += len(chunk)
         else:
             break
 
+    result = "\n\n---\n\n".join(selected)
+
     if not result and chunks:
         result = chunks[0][: max_chars - 50] + "...\n[Content truncated]"
 
     return result or "Content processing error"
 
 
+@lru_cache(maxsize=256)
 def get_knowledge_file_path(filename: str, subfolder: Optional[str] = None) -> Path:
     """
     Get the full path to a knowledge base file.
 
+    Tools only ask for a handful of literal filenames, so the joined paths
+    are memoized.
+
     Args:
         filename: Name of the file
         subfolder: Optional subfolder within knowledge base
@@ -184,9 +456,7 @@ def get_knowledge_file_path(filename: str, subfolder: Optional[str] = None) -> P
     Returns:
         Path object for the knowledge base file
     """
-    base_path = Path("myawesomefakecompanyBaseKnowledge")
-
     if subfolder:
-        return base_path / subfolder / filename
+        return KNOWLEDGE_BASE_DIR / subfolder / filename
     else:
-        return base_path / filename
+        return KNOWLEDGE_BASE_DIR / filename
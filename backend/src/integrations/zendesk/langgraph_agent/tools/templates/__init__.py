@@ -5,7 +5,10 @@ This module provides a centralized interface for accessing all ticket templates
 and configurations in a clean, organized way.
 """
 
+import sys
+
 from .ticket_configs import (
+    SUPPORT_TICKET_CONFIGS,
     get_support_ticket_config,
     get_sales_ticket_tags,
     get_sales_ticket_priority,
@@ -15,70 +18,62 @@ from .ticket_descriptions import format_support_description, format_sales_descri
 from .customer_responses import get_customer_response, get_error_response
 
 
-class TicketTemplateManager:
-    """Central manager for all ticket templates and configurations."""
+# Ticket subjects only depend on the configured prefix, so build them once
+_SUPPORT_SUBJECTS = {
+    ticket_type: f"{config['subject_prefix']} Customer Support Request"
+    for ticket_type, config in SUPPORT_TICKET_CONFIGS.items()
+}
+_SALES_SUBJECT = f"{SALES_TICKET_CONFIG['subject_prefix']} Customer Support Request"
 
-    @staticmethod
-    def get_support_ticket_data(
-        ticket_type: str, customer_info: str, request_summary: str
-    ) -> dict:
-        """Get complete ticket data for a support ticket."""
-        config = get_support_ticket_config(ticket_type)
-        description = format_support_description(
-            ticket_type, customer_info, request_summary
-        )
-        subject = f"{config['subject_prefix']} Customer Support Request"
 
-        return {
-            "subject": subject,
-            "description": description,
-            "zendesk_type": config["zendesk_type"],
-            "priority": config["priority"],
-            "tags": config["tags"],
-        }
+def get_support_ticket_data(
+    ticket_type: str, customer_info: str, request_summary: str
+) -> dict:
+    """Get complete ticket data for a support ticket."""
+    config = get_support_ticket_config(ticket_type)
+    description = format_support_description(
+        ticket_type, customer_info, request_summary
+    )
+    subject = _SUPPORT_SUBJECTS.get(ticket_type.lower(), _SUPPORT_SUBJECTS["general"])
 
-    @staticmethod
-    def get_sales_ticket_data(
-        customer_info: str,
-        request_summary: str,
-        sales_context: str,
-        interest_level: str,
-    ) -> dict:
-        """Get complete ticket data for a sales ticket."""
-        description = format_sales_description(
-            customer_info, request_summary, sales_context
-        )
-        subject = f"{SALES_TICKET_CONFIG['subject_prefix']} Customer Support Request"
-        priority = get_sales_ticket_priority(interest_level)
-        tags = get_sales_ticket_tags(interest_level)
+    return {
+        "subject": subject,
+        "description": description,
+        "zendesk_type": config["zendesk_type"],
+        "priority": config["priority"],
+        "tags": list(config["tags"]),
+    }
 
-        return {
-            "subject": subject,
-            "description": description,
-            "zendesk_type": SALES_TICKET_CONFIG["zendesk_type"],
-            "priority": priority,
-            "tags": tags,
-        }
 
-    @staticmethod
-    def get_customer_response(response_type: str, ticket_id: int) -> str:
-        """Get customer response message."""
-        return get_customer_response(response_type, ticket_id)
+def get_sales_ticket_data(
+    customer_info: str,
+    request_summary: str,
+    sales_context: str,
+    interest_level: str,
+) -> dict:
+    """Get complete ticket data for a sales ticket."""
+    description = format_sales_description(
+        customer_info, request_summary, sales_context
+    )
 
-    @staticmethod
-    def get_error_response(error_type: str = "general_error") -> str:
-        """Get error response message."""
-        return get_error_response(error_type)
+    return {
+        "subject": _SALES_SUBJECT,
+        "description": description,
+        "zendesk_type": SALES_TICKET_CONFIG["zendesk_type"],
+        "priority": get_sales_ticket_priority(interest_level),
+        "tags": get_sales_ticket_tags(interest_level),
+    }
 
 
-# Create a global instance for easy import
-template_manager = TicketTemplateManager()
+# Old callers use template_manager.<function>; the module itself serves that role
+template_manager = sys.modules[__name__]
 
 
 # Export main functions for direct import
 __all__ = [
     "template_manager",
-    "TicketTemplateManager",
+    "get_support_ticket_data",
+    "get_sales_ticket_data",
     "get_support_ticket_config",
     "get_sales_ticket_tags",
     "get_sales_ticket_priority",
@@ -6,9 +6,8 @@ after creating different types of support tickets.
 """
 
 
-def _billing_response() -> str:
-    """Billing support ticket confirmation message."""
-    return """
+# Billing support ticket confirmation message
+_BILLING_RESPONSE = """
     I've created a billing support ticket #{ticket_id} to address your concern.
 
     Our billing specialists will review your account and contact you within
@@ -18,9 +17,8 @@ def _billing_response() -> str:
     """.strip()
 
 
-def _technical_response() -> str:
-    """Technical support ticket confirmation message."""
-    return """
+# Technical support ticket confirmation message
+_TECHNICAL_RESPONSE = """
     I've created a technical support ticket #{ticket_id} for your issue.
 
     Our technical team will investigate and contact you with troubleshooting steps
@@ -30,9 +28,8 @@ def _technical_response() -> str:
     """.strip()
 
 
-def _cancellation_response() -> str:
-    """Cancellation request ticket confirmation message."""
-    return """
+# Cancellation request ticket confirmation message
+_CANCELLATION_RESPONSE = """
     I've created ticket #{ticket_id} for your cancellation request.
 
     Our customer retention team will reach out within 24 hours to discuss your account
@@ -43,9 +40,8 @@ def _cancellation_response() -> str:
     """.strip()
 
 
-def _general_response() -> str:
-    """General inquiry ticket confirmation message."""
-    return """
+# General inquiry ticket confirmation message
+_GENERAL_RESPONSE = """
     I've created ticket #{ticket_id} to ensure you get the most accurate information.
 
     Our customer service team will follow up with detailed information within 24 hours.
@@ -55,9 +51,8 @@ def _general_response() -> str:
     """.strip()
 
 
-def _sales_response() -> str:
-    """Sales inquiry ticket confirmation message."""
-    return """
+# Sales inquiry ticket confirmation message
+_SALES_RESPONSE = """
     Excellent! I've prioritized your sales inquiry as ticket #{ticket_id}.
 
     A MyAwesomeFakeCompany sales specialist will contact you within 4 hours to discuss your
@@ -73,17 +68,22 @@ def _sales_response() -> str:
 
 # Customer response templates for support tickets
 CUSTOMER_RESPONSE_TEMPLATES = {
-    "billing": _billing_response(),
-    "technical": _technical_response(),
-    "cancellation": _cancellation_response(),
-    "general": _general_response(),
-    "sales": _sales_response(),
+    "billing": _BILLING_RESPONSE,
+    "technical": _TECHNICAL_RESPONSE,
+    "cancellation": _CANCELLATION_RESPONSE,
+    "general": _GENERAL_RESPONSE,
+    "sales": _SALES_RESPONSE,
+}
+
+# Templates pre-split around the ticket ID placeholder, so rendering is a single join
+_CUSTOMER_RESPONSE_PARTS = {
+    response_type: tuple(template.split("{ticket_id}"))
+    for response_type, template in CUSTOMER_RESPONSE_TEMPLATES.items()
 }
 
 
-def _general_error_response() -> str:
-    """General error message when ticket creation fails."""
-    return """
+# General error message when ticket creation fails
+_GENERAL_ERROR_RESPONSE = """
     I apologize, but I'm having trouble creating a support ticket right now.
 
     Please contact MyAwesomeFakeCompany customer service directly:
@@ -96,9 +96,8 @@ def _general_error_response() -> str:
     """.strip()
 
 
-def _sales_error_response() -> str:
-    """Sales-specific error message when ticket creation fails."""
-    return """
+# Sales-specific error message when ticket creation fails
+_SALES_ERROR_RESPONSE = """
     I apologize for the technical difficulty. For immediate sales assistance,
     please contact our sales team directly at 1-800-NEW-PLAN.
 
@@ -109,8 +108,8 @@ def _sales_error_response() -> str:
 
 # Error response templates
 ERROR_RESPONSE_TEMPLATES = {
-    "general_error": _general_error_response(),
-    "sales_error": _sales_error_response(),
+    "general_error": _GENERAL_ERROR_RESPONSE,
+    "sales_error": _SALES_ERROR_RESPONSE,
 }
 
 
@@ -125,10 +124,10 @@ def get_customer_response(response_type: str, ticket_id: int) -> str:
     Returns:
         Formatted customer response message with ticket ID
     """
-    template = CUSTOMER_RESPONSE_TEMPLATES.get(
-        response_type.lower(), CUSTOMER_RESPONSE_TEMPLATES["general"]
+    parts = _CUSTOMER_RESPONSE_PARTS.get(
+        response_type.lower(), _CUSTOMER_RESPONSE_PARTS["general"]
     )
-    return template.format(ticket_id=ticket_id)
+    return str(ticket_id).join(parts)
 
 
 def get_error_response(error_type: str = "general_error") -> str:
@@ -5,43 +5,64 @@ This module defines the ticket types, priorities, tags, and prefixes
 for different categories of customer support requests.
 """
 
-# Support ticket configurations
-SUPPORT_TICKET_CONFIGS = {
-    "billing": {
-        "zendesk_type": "problem",
-        "priority": "high",
-        "tags": ["billing", "payment", "customer_service"],
-        "subject_prefix": "[BILLING]",
-    },
-    "technical": {
-        "zendesk_type": "incident",
-        "priority": "normal",
-        "tags": ["technical", "support", "troubleshooting"],
-        "subject_prefix": "[TECH]",
-    },
-    "cancellation": {
-        "zendesk_type": "task",
-        "priority": "high",
-        "tags": ["cancellation", "retention", "churn_risk"],
-        "subject_prefix": "[RETENTION]",
-    },
-    "general": {
-        "zendesk_type": "question",
-        "priority": "normal",
-        "tags": ["general", "inquiry", "information"],
-        "subject_prefix": "[INFO]",
-    },
-}
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Support ticket configurations (read-only; tags are tuples shared by every ticket)
+SUPPORT_TICKET_CONFIGS = MappingProxyType(
+    {
+        "billing": MappingProxyType(
+            {
+                "zendesk_type": "problem",
+                "priority": "high",
+                "tags": ("billing", "payment", "customer_service"),
+                "subject_prefix": "[BILLING]",
+            }
+        ),
+        "technical": MappingProxyType(
+            {
+                "zendesk_type": "incident",
+                "priority": "normal",
+                "tags": ("technical", "support", "troubleshooting"),
+                "subject_prefix": "[TECH]",
+            }
+        ),
+        "cancellation": MappingProxyType(
+            {
+                "zendesk_type": "task",
+                "priority": "high",
+                "tags": ("cancellation", "retention", "churn_risk"),
+                "subject_prefix": "[RETENTION]",
+            }
+        ),
+        "general": MappingProxyType(
+            {
+                "zendesk_type": "question",
+                "priority": "normal",
+                "tags": ("general", "inquiry", "information"),
+                "subject_prefix": "[INFO]",
+            }
+        ),
+    }
+)
 
 # Sales ticket configuration
-SALES_TICKET_CONFIG = {
-    "zendesk_type": "task",
-    "subject_prefix": "[HOT LEAD] [SALES]",
-    "tags_base": ["sales", "new_customer", "revenue_opportunity", "hot_lead"],
+SALES_TICKET_CONFIG = MappingProxyType(
+    {
+        "zendesk_type": "task",
+        "subject_prefix": "[HOT LEAD] [SALES]",
+        "tags_base": ("sales", "new_customer", "revenue_opportunity", "hot_lead"),
+    }
+)
+
+# Full sales tag sets for each known interest level, built once at import
+_SALES_TAGS_BY_LEVEL = {
+    level: (*SALES_TICKET_CONFIG["tags_base"], f"interest_{level}")
+    for level in ("low", "medium", "high")
 }
 
 
-def get_support_ticket_config(ticket_type: str) -> dict:
+def get_support_ticket_config(ticket_type: str) -> Mapping[str, Any]:
     """
     Get configuration for a support ticket type.
 
@@ -49,7 +70,7 @@ def get_support_ticket_config(ticket_type: str) -> dict:
         ticket_type: Type of support ticket (billing, technical, cancellation, general)
 
     Returns:
-        Dictionary containing zendesk_type, priority, tags, and subject_prefix
+        Read-only mapping containing zendesk_type, priority, tags, and subject_prefix
     """
     return SUPPORT_TICKET_CONFIGS.get(
         ticket_type.lower(), SUPPORT_TICKET_CONFIGS["general"]
@@ -66,9 +87,11 @@ def get_sales_ticket_tags(interest_level: str) -> list:
     Returns:
         List of tags including base sales tags and interest level tag
     """
-    tags = SALES_TICKET_CONFIG["tags_base"].copy()
-    tags.append(f"interest_{interest_level}")
-    return tags
+    tags = _SALES_TAGS_BY_LEVEL.get(interest_level)
+    if tags is None:
+        return [*SALES_TICKET_CONFIG["tags_base"], f"interest_{interest_level}"]
+    # Fresh list so callers can't mutate the shared tag set
+    return list(tags)
 
 
 def get_sales_ticket_priority(interest_level: str) -> str:
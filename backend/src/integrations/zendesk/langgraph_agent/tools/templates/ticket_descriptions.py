@@ -5,10 +5,11 @@ This module contains the templates used to format ticket descriptions
 for different types of support requests.
 """
 
+from types import MappingProxyType
 
-def _billing_template() -> str:
-    """Billing support ticket description template."""
-    return """
+
+# Billing support ticket description template
+_BILLING_TEMPLATE = """
     Customer has a billing-related issue.
 
     Customer Details:
@@ -24,9 +25,8 @@ def _billing_template() -> str:
     """.strip()
 
 
-def _technical_template() -> str:
-    """Technical support ticket description template."""
-    return """
+# Technical support ticket description template
+_TECHNICAL_TEMPLATE = """
     Customer experiencing technical issues.
 
     Customer Details:
@@ -42,9 +42,8 @@ def _technical_template() -> str:
     """.strip()
 
 
-def _cancellation_template() -> str:
-    """Cancellation request ticket description template."""
-    return """
+# Cancellation request ticket description template
+_CANCELLATION_TEMPLATE = """
     Customer requesting service cancellation.
 
     Customer Details:
@@ -61,9 +60,8 @@ def _cancellation_template() -> str:
     """.strip()
 
 
-def _general_template() -> str:
-    """General inquiry ticket description template."""
-    return """
+# General inquiry ticket description template
+_GENERAL_TEMPLATE = """
     General customer inquiry.
 
     Customer Details:
@@ -78,18 +76,19 @@ def _general_template() -> str:
     """.strip()
 
 
-# Support ticket description templates
-SUPPORT_DESCRIPTION_TEMPLATES = {
-    "billing": _billing_template(),
-    "technical": _technical_template(),
-    "cancellation": _cancellation_template(),
-    "general": _general_template(),
-}
+# Support ticket description templates (read-only)
+SUPPORT_DESCRIPTION_TEMPLATES = MappingProxyType(
+    {
+        "billing": _BILLING_TEMPLATE,
+        "technical": _TECHNICAL_TEMPLATE,
+        "cancellation": _CANCELLATION_TEMPLATE,
+        "general": _GENERAL_TEMPLATE,
+    }
+)
 
 
-def _sales_template() -> str:
-    """Sales inquiry ticket description template."""
-    return """
+# Sales inquiry ticket description template
+_SALES_TEMPLATE = """
     Customer interested in MyAwesomeFakeCompany services.
 
     Customer Details:
@@ -110,7 +109,7 @@ def _sales_template() -> str:
 
 
 # Sales ticket description template
-SALES_DESCRIPTION_TEMPLATE = _sales_template()
+SALES_DESCRIPTION_TEMPLATE = _SALES_TEMPLATE
 
 
 def format_support_description(
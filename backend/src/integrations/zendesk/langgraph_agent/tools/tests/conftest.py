@@ -1,25 +1,69 @@
 """Fixtures for tool tests."""
+import importlib
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from pathlib import Path
 
+from src.integrations.zendesk.langgraph_agent.tools import zendesk_tools
+
+# The package re-exports the awesome_company_tools list under the module's name
+awesome_company_tools_module = importlib.import_module(
+    "src.integrations.zendesk.langgraph_agent.tools.awesome_company_tools"
+)
+
+# Returned by the mocked path lookup; the extractors are mocked, so it is never read
+FAKE_KNOWLEDGE_PATH = Path("/fake/path/knowledge.pdf")
+
+
+@pytest.fixture
+def mock_ticket_service(monkeypatch):
+    """Mock the shared TicketService handed to the tools."""
+    mock_service = AsyncMock()
+    monkeypatch.setattr(
+        zendesk_tools, "get_shared_ticket_service", AsyncMock(return_value=mock_service)
+    )
+    return mock_service
+
 
 @pytest.fixture
-def mock_get_zendesk_client():
-    """Mock get_zendesk_client context manager."""
-    mock_client = AsyncMock()
-    mock_client.create_ticket = AsyncMock()
-    mock_client.search_tickets_by_email = AsyncMock()
-    mock_client.get_ticket_by_id = AsyncMock()
+def mock_knowledge_files(monkeypatch):
+    """Mock knowledge base path lookup and content extraction for the tools."""
+    mocks = SimpleNamespace(
+        get_path=MagicMock(return_value=FAKE_KNOWLEDGE_PATH),
+        extract_pdf=MagicMock(),
+        extract_text=MagicMock(),
+    )
+    monkeypatch.setattr(
+        awesome_company_tools_module, "get_knowledge_file_path", mocks.get_path
+    )
+    monkeypatch.setattr(
+        awesome_company_tools_module, "extract_pdf_content_chunked", mocks.extract_pdf
+    )
+    monkeypatch.setattr(
+        awesome_company_tools_module, "extract_text_content_chunked", mocks.extract_text
+    )
+    return mocks
 
-    # Mock the context manager
-    async def async_context_manager():
-        return mock_client
 
-    with patch('src.integrations.zendesk.langgraph_agent.tools.zendesk_tools.get_zendesk_client') as mock:
-        mock.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock.return_value.__aexit__ = AsyncMock(return_value=None)
-        yield mock_client
+@pytest.fixture(scope="module")
+def make_ticket():
+    """Factory for lightweight ticket stand-ins exposing ZendeskTicket's fields."""
+
+    def _make_ticket(**fields):
+        defaults = {
+            "id": 1,
+            "subject": "Support Request",
+            "status": "open",
+            "priority": "normal",
+            "description": None,
+            "created_at": None,
+            "tags": [],
+        }
+        return SimpleNamespace(**{**defaults, **fields})
+
+    return _make_ticket
 
 
 @pytest.fixture
@@ -32,10 +76,13 @@ def sample_customer_info():
     }
 
 
-@pytest.fixture
-def mock_knowledge_base_path(tmp_path):
-    """Create a temporary knowledge base directory with sample files."""
-    kb_dir = tmp_path / "myawesomefakecompanyBaseKnowledge"
+@pytest.fixture(scope="session")
+def mock_knowledge_base_path(tmp_path_factory):
+    """Create a temporary knowledge base directory with sample files.
+
+    Built once per session; tests must treat it as read-only.
+    """
+    kb_dir = tmp_path_factory.mktemp("kb") / "myawesomefakecompanyBaseKnowledge"
     kb_dir.mkdir()
 
     # Create sample files
@@ -0,0 +1,218 @@
+"""
+Unit tests for knowledge base extraction utilities.
+
+These tests verify chunked extraction and the per-file parse cache.
+"""
+import os
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from src.integrations.zendesk.langgraph_agent.tools import knowledge_utils
+from src.integrations.zendesk.langgraph_agent.tools.knowledge_utils import (
+    aextract_many,
+    aextract_text_content_chunked,
+    extract_pdf_content_chunked,
+    extract_text_content_chunked,
+    get_knowledge_file_path,
+    preload_knowledge_base,
+)
+
+
+KNOWLEDGE_BASE_DIR = Path(__file__).resolve().parents[6] / "myawesomefakecompanyBaseKnowledge"
+
+
+@pytest.fixture(autouse=True)
+def clear_chunk_cache(tmp_path):
+    """Reset the parsed-chunk caches so each test starts cold."""
+    knowledge_utils._extract_relevant.cache_clear()
+    knowledge_utils._load_and_split.cache_clear()
+    knowledge_utils.get_knowledge_file_path.cache_clear()
+    with patch.object(knowledge_utils, "KNOWLEDGE_CACHE_DIR", tmp_path / "cache"):
+        yield
+    knowledge_utils._extract_relevant.cache_clear()
+    knowledge_utils._load_and_split.cache_clear()
+    knowledge_utils.get_knowledge_file_path.cache_clear()
+
+
+@pytest.fixture
+def story_file(tmp_path):
+    """A small knowledge base text file."""
+    path = tmp_path / "story.txt"
+    path.write_text("MyAwesomeFakeCompany offers internet plans from $29.99/month.")
+    return path
+
+
+@pytest.mark.unit
+class TestKnowledgeExtractionCache:
+    """Test that parsed knowledge base files are cached."""
+
+    def test_repeated_extraction_parses_once(self, story_file):
+        """Test that a second call reuses the cached chunks."""
+        with patch.object(
+            knowledge_utils, "TextLoader", wraps=knowledge_utils.TextLoader
+        ) as mock_loader:
+            first = extract_text_content_chunked(story_file, max_chars=500)
+            second = extract_text_content_chunked(story_file, max_chars=500)
+
+        assert first == second
+        assert "$29.99" in first
+        assert mock_loader.call_count == 1
+
+    def test_modified_file_is_reparsed(self, story_file):
+        """Test that changing the file's mtime invalidates the cache."""
+        extract_text_content_chunked(story_file, max_chars=500)
+
+        story_file.write_text("Gigabit fiber plan now available for $79.99/month.")
+        stat = story_file.stat()
+        os.utime(story_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = extract_text_content_chunked(story_file, max_chars=500)
+
+        assert "$79.99" in result
+
+    def test_repeated_extraction_scores_once(self, story_file):
+        """Test that a warm call skips chunk scoring entirely."""
+        with patch.object(
+            knowledge_utils,
+            "_select_relevant_chunks",
+            wraps=knowledge_utils._select_relevant_chunks,
+        ) as mock_select:
+            extract_text_content_chunked(story_file, max_chars=500)
+            extract_text_content_chunked(story_file, max_chars=500)
+
+        assert mock_select.call_count == 1
+
+    def test_disk_cache_survives_process_cache_reset(self, story_file):
+        """Test that a cold in-process cache is served from the disk cache."""
+        first = extract_text_content_chunked(story_file, max_chars=500)
+        knowledge_utils._extract_relevant.cache_clear()
+        knowledge_utils._load_and_split.cache_clear()
+
+        with patch.object(knowledge_utils, "TextLoader") as mock_loader:
+            second = extract_text_content_chunked(story_file, max_chars=500)
+
+        assert second == first
+        mock_loader.assert_not_called()
+
+    def test_disk_cache_ignores_other_cache_versions(self, story_file):
+        """Test that entries written by another parser version are re-parsed."""
+        extract_text_content_chunked(story_file, max_chars=500)
+        knowledge_utils._extract_relevant.cache_clear()
+        knowledge_utils._load_and_split.cache_clear()
+
+        with patch.object(knowledge_utils, "KNOWLEDGE_CACHE_VERSION", "next"), patch.object(
+            knowledge_utils, "TextLoader", wraps=knowledge_utils.TextLoader
+        ) as mock_loader:
+            extract_text_content_chunked(story_file, max_chars=500)
+
+        assert mock_loader.call_count == 1
+
+    def test_missing_file_is_not_cached(self, tmp_path):
+        """Test that missing files return the not-found message."""
+        result = extract_text_content_chunked(tmp_path / "missing.txt")
+
+        assert result == "File not found: missing.txt"
+        assert knowledge_utils._load_and_split.cache_info().currsize == 0
+
+    def test_knowledge_file_path_reused(self):
+        """Test that repeated lookups return the same Path object."""
+        first = get_knowledge_file_path("FAQ.pdf", subfolder="FAQ")
+        second = get_knowledge_file_path("FAQ.pdf", subfolder="FAQ")
+
+        assert first is second
+        assert first == knowledge_utils.KNOWLEDGE_BASE_DIR / "FAQ" / "FAQ.pdf"
+
+
+@pytest.mark.unit
+class TestPdfExtraction:
+    """Test PDF text extraction."""
+
+    def test_pdf_pages_extracted_without_carriage_returns(self):
+        """Test that a knowledge base PDF yields clean page text."""
+        pdf_path = KNOWLEDGE_BASE_DIR / "TeleCorp Plans and Services - Complete Guide.pdf"
+
+        pages = knowledge_utils._read_pdf_pages(str(pdf_path))
+        result = extract_pdf_content_chunked(pdf_path, max_chars=2000)
+
+        assert "Basic Internet" in pages[0]
+        assert not any("\r" in page for page in pages)
+        assert "$" in result
+
+    def test_pdf_pages_from_bytes_match_path(self):
+        """Test that parsing already-read bytes matches parsing the file path."""
+        pdf_path = KNOWLEDGE_BASE_DIR / "TeleCorp Plans and Services - Complete Guide.pdf"
+
+        from_bytes = knowledge_utils._read_pdf_pages(pdf_path.read_bytes())
+
+        assert from_bytes == knowledge_utils._read_pdf_pages(str(pdf_path))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncKnowledgeExtraction:
+    """Test the async extraction variants."""
+
+    async def test_async_matches_sync_result(self, story_file):
+        """Test that the async variant returns the same content as the sync one."""
+        result = await aextract_text_content_chunked(story_file, max_chars=500)
+
+        assert result == extract_text_content_chunked(story_file, max_chars=500)
+
+    async def test_extract_many_preserves_order(self, story_file, tmp_path):
+        """Test that batched extraction returns one result per path, in order."""
+        missing = tmp_path / "missing.pdf"
+
+        results = await aextract_many([missing, story_file], max_chars=500)
+
+        assert results == [
+            "File not found: missing.pdf",
+            extract_text_content_chunked(story_file, max_chars=500),
+        ]
+
+    async def test_preload_warms_cache_for_tool_calls(self, story_file, tmp_path):
+        """Test that preloaded files are served without re-parsing."""
+        with patch.object(knowledge_utils, "KNOWLEDGE_BASE_DIR", tmp_path):
+            file_count = await preload_knowledge_base(max_chars=500)
+
+        with patch.object(knowledge_utils, "TextLoader") as mock_loader:
+            result = extract_text_content_chunked(story_file, max_chars=500)
+
+        assert file_count == 1
+        assert "$29.99" in result
+        mock_loader.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSelectRelevantChunks:
+    """Test key-term scoring of chunks."""
+
+    def test_pricing_chunk_ranked_first(self):
+        """Test that chunks with plan pricing outrank unrelated text."""
+        chunks = [
+            "Our office is open on weekdays.",
+            "The Premium Plan costs $79.99/month with unlimited data.",
+        ]
+
+        result = knowledge_utils._select_relevant_chunks(chunks, max_chars=70)
+
+        assert result == chunks[1]
+
+    def test_key_terms_match_case_insensitively(self):
+        """Test that upper-case key terms still count toward the score."""
+        chunks = ["nothing relevant here", "FIBER INTERNET with WIFI ROUTER"]
+
+        result = knowledge_utils._select_relevant_chunks(chunks, max_chars=45)
+
+        assert result == chunks[1]
+
+    def test_duplicate_chunks_selected_once(self):
+        """Test that repeated chunks do not crowd out distinct content."""
+        footer = "MyAwesomeFakeCompany internet plans - page footer"
+        chunks = [footer, footer, "Basic Plan costs $29.99/month."]
+
+        result = knowledge_utils._select_relevant_chunks(chunks, max_chars=500)
+
+        assert result.count(footer) == 1
+        assert "$29.99" in result
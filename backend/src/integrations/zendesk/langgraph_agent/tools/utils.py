@@ -28,6 +28,14 @@ PRIORITY_EMOJIS = {
     "urgent": "🔴",
 }
 
+# Display strings for the known Zendesk values, built once
+_STATUS_DISPLAY = {
+    status: f"{emoji} {status.title()}" for status, emoji in STATUS_EMOJIS.items()
+}
+_PRIORITY_DISPLAY = {
+    priority: f"{emoji} {priority.title()}" for priority, emoji in PRIORITY_EMOJIS.items()
+}
+
 VALIDATION_MESSAGES = {
     "missing_name_email_support": """
         I'd be happy to create a support ticket for you! To ensure our team can follow up properly, I'll need to get some information from you first.
@@ -62,6 +70,11 @@ VALIDATION_MESSAGES = {
 HIDDEN_TICKET_TAGS = ["[SALES]", "[HOT LEAD]", "[LEAD]"]
 HIDDEN_TAG_FIELDS = ["sales", "lead", "hot_lead"]
 
+# Placeholder names the agent fills in when the customer has not given one
+PLACEHOLDER_CUSTOMER_NAMES = frozenset(
+    ("MyAwesomeFakeCompany Customer", "Prospective Customer")
+)
+
 
 # ============================================================================
 # VALIDATION FUNCTIONS
@@ -83,9 +96,7 @@ def validate_customer_info(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    invalid_names = ["MyAwesomeFakeCompany Customer", "Prospective Customer"]
-
-    if not name or name in invalid_names:
+    if not name or name in PLACEHOLDER_CUSTOMER_NAMES:
         msg_key = (
             "missing_name_email_sales"
             if ticket_type == "sales"
@@ -137,14 +148,18 @@ def build_sales_context(interest_level: str, conversation_summary: str) -> str:
 
 def get_status_display(status: str) -> str:
     """Get emoji + status display."""
-    emoji = STATUS_EMOJIS.get(status, "📄")
-    return f"{emoji} {status.title()}"
+    display = _STATUS_DISPLAY.get(status)
+    if display is None:
+        display = f"📄 {status.title()}"
+    return display
 
 
 def get_priority_display(priority: str) -> str:
     """Get emoji + priority display."""
-    emoji = PRIORITY_EMOJIS.get(priority, "📋")
-    return f"{emoji} {priority.title()}"
+    display = _PRIORITY_DISPLAY.get(priority)
+    if display is None:
+        display = f"📋 {priority.title()}"
+    return display
 
 
 # ============================================================================
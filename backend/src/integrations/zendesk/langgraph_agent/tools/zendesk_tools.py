@@ -4,12 +4,18 @@ Zendesk ticket creation tools for MyAwesomeFakeCompany LangGraph agents.
 This module provides tools for creating and managing Zendesk tickets.
 """
 
+import re
+
 from langchain_core.tools import tool
 from src.core.logging_config import get_logger
-from src.integrations.zendesk.client import get_zendesk_client
-from src.integrations.zendesk.service import TicketService
+from src.integrations.zendesk.service import get_shared_ticket_service
 
-from .templates import template_manager
+from .templates import (
+    get_customer_response,
+    get_error_response,
+    get_sales_ticket_data,
+    get_support_ticket_data,
+)
 from .utils import (
     validate_customer_info,
     format_customer_info,
@@ -22,6 +28,27 @@ from .utils import (
 
 logger = get_logger("zendesk_tools")
 
+_VALID_PRIORITIES = frozenset(("low", "normal", "high", "urgent"))
+
+# Customers with several addresses may give them together, e.g. "a@x.com, b@y.com"
+_EMAIL_SEPARATOR_RE = re.compile(r"[,;\s]+")
+
+_TICKET_DETAILS_TEMPLATE = """Here are the details for Ticket #{id}:
+
+**Subject:** {subject}
+**Status:** {status}
+**Priority:** {priority}
+**Created:** {created}
+
+**Original Request:**
+{description}
+
+How can I help you with this ticket? Would you like to:
+• Check for updates on this issue
+• Add more information
+• Ask questions about the resolution
+• Something else?"""
+
 
 @tool
 async def create_support_ticket(
@@ -64,7 +91,7 @@ async def create_support_ticket(
         if conversation_context:
             request_summary += f"\n\nAdditional Context:\n{conversation_context}"
 
-        ticket_data = template_manager.get_support_ticket_data(
+        ticket_data = get_support_ticket_data(
             ticket_type=ticket_type,
             customer_info=customer_info,
             request_summary=request_summary,
@@ -72,28 +99,27 @@ async def create_support_ticket(
 
         final_priority = (
             priority
-            if priority in ["low", "normal", "high", "urgent"]
+            if priority in _VALID_PRIORITIES
             else ticket_data["priority"]
         )
 
-        async with await get_zendesk_client() as zendesk_client:
-            ticket_service = TicketService(zendesk_client)
+        ticket_service = await get_shared_ticket_service()
 
-            created_ticket = await ticket_service.create_ticket(
-                subject=ticket_data["subject"],
-                description=ticket_data["description"],
-                requester_email=customer_email,
-                requester_name=customer_name,
-                ticket_type=ticket_data["zendesk_type"],
-                priority=final_priority,
-                tags=ticket_data["tags"],
-            )
+        created_ticket = await ticket_service.create_ticket(
+            subject=ticket_data["subject"],
+            description=ticket_data["description"],
+            requester_email=customer_email,
+            requester_name=customer_name,
+            ticket_type=ticket_data["zendesk_type"],
+            priority=final_priority,
+            tags=ticket_data["tags"],
+        )
 
-        return template_manager.get_customer_response(ticket_type, created_ticket.id)
+        return get_customer_response(ticket_type, created_ticket.id)
 
-    except Exception as e:
-        logger.error(f"Failed to create support ticket: {str(e)}")
-        return template_manager.get_error_response("general_error")
+    except Exception:
+        logger.exception("Failed to create support ticket")
+        return get_error_response("general_error")
 
 
 @tool
@@ -136,31 +162,30 @@ async def create_sales_ticket(
         )
         sales_context = build_sales_context(interest_level, conversation_summary)
 
-        ticket_data = template_manager.get_sales_ticket_data(
+        ticket_data = get_sales_ticket_data(
             customer_info=customer_info,
             request_summary=customer_message,
             sales_context=sales_context,
             interest_level=interest_level,
         )
 
-        async with await get_zendesk_client() as zendesk_client:
-            ticket_service = TicketService(zendesk_client)
+        ticket_service = await get_shared_ticket_service()
 
-            created_ticket = await ticket_service.create_ticket(
-                subject=ticket_data["subject"],
-                description=ticket_data["description"],
-                requester_email=customer_email,
-                requester_name=customer_name,
-                ticket_type=ticket_data["zendesk_type"],
-                priority=ticket_data["priority"],
-                tags=ticket_data["tags"],
-            )
+        created_ticket = await ticket_service.create_ticket(
+            subject=ticket_data["subject"],
+            description=ticket_data["description"],
+            requester_email=customer_email,
+            requester_name=customer_name,
+            ticket_type=ticket_data["zendesk_type"],
+            priority=ticket_data["priority"],
+            tags=ticket_data["tags"],
+        )
 
-        return template_manager.get_customer_response("sales", created_ticket.id)
+        return get_customer_response("sales", created_ticket.id)
 
-    except Exception as e:
-        logger.error(f"Failed to create sales ticket: {str(e)}")
-        return template_manager.get_error_response("sales_error")
+    except Exception:
+        logger.exception("Failed to create sales ticket")
+        return get_error_response("sales_error")
 
 
 @tool
@@ -172,7 +197,8 @@ async def get_user_tickets(customer_email: str) -> str:
     that they might want to discuss or follow up on.
 
     Args:
-        customer_email: Customer's email address to search for tickets
+        customer_email: Customer's email address to search for tickets; several
+            addresses may be given separated by commas
 
     Returns:
         Formatted list of customer tickets with IDs, subjects, and status,
@@ -182,9 +208,22 @@ async def get_user_tickets(customer_email: str) -> str:
         if not customer_email:
             return "I'll need your email address to look up your tickets. Could you please provide your email?"
 
-        async with await get_zendesk_client() as zendesk_client:
-            ticket_service = TicketService(zendesk_client)
-            tickets = await ticket_service.search_tickets_by_email(customer_email)
+        emails = [email for email in _EMAIL_SEPARATOR_RE.split(customer_email) if email]
+        if not emails:
+            return "I'll need your email address to look up your tickets. Could you please provide your email?"
+
+        ticket_service = await get_shared_ticket_service()
+        if len(emails) == 1:
+            tickets = await ticket_service.search_tickets_by_email(emails[0])
+        else:
+            # One search for every address; a ticket is listed once even if matched twice
+            tickets_by_email = await ticket_service.search_tickets_by_emails(emails)
+            tickets = list({
+                ticket.id: ticket
+                for email_tickets in tickets_by_email.values()
+                for ticket in email_tickets
+            }.values())
+        customer_email = ", ".join(emails)
 
         if not tickets:
             return f"I didn't find any existing tickets for {customer_email}. You appear to be a new customer or haven't contacted support before. How can I help you today?"
@@ -209,8 +248,8 @@ Which would you prefer?"""
 
         return response
 
-    except Exception as e:
-        logger.error(f"Failed to get user tickets: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get user tickets")
         return "I'm having trouble accessing your ticket history right now. Let me help you with your current question instead. What can I assist you with today?"
 
 
@@ -233,36 +272,31 @@ async def get_ticket_details(ticket_id: str, customer_email: str) -> str:
         if not ticket_id or not customer_email:
             return "I'll need both the ticket ID and your email address to look up the ticket details."
 
-        async with await get_zendesk_client() as zendesk_client:
-            ticket_service = TicketService(zendesk_client)
-            ticket = await ticket_service.get_ticket_by_id(int(ticket_id))
-
-            if not ticket:
-                return f"I couldn't find ticket #{ticket_id}. Please double-check the ticket number."
+        ticket_id = ticket_id.strip()
+        if not ticket_id.isdecimal():
+            return "That doesn't look like a valid ticket number. Ticket numbers contain only digits - could you double-check it?"
 
-        status_display = get_status_display(ticket.status)
-        priority_display = get_priority_display(ticket.priority)
+        ticket_service = await get_shared_ticket_service()
+        ticket = await ticket_service.get_ticket_by_id(int(ticket_id))
 
-        response = f"""Here are the details for Ticket #{ticket.id}:
-
-**Subject:** {ticket.subject}
-**Status:** {status_display}
-**Priority:** {priority_display}
-**Created:** {ticket.created_at.strftime('%B %d, %Y at %I:%M %p') if ticket.created_at else 'Unknown'}
-
-**Original Request:**
-{ticket.description[:500] if ticket.description else 'No description available'}{"..." if ticket.description and len(ticket.description) > 500 else ""}
+        if not ticket:
+            return f"I couldn't find ticket #{ticket_id}. Please double-check the ticket number."
 
-How can I help you with this ticket? Would you like to:
-• Check for updates on this issue
-• Add more information
-• Ask questions about the resolution
-• Something else?"""
+        description = ticket.description or "No description available"
+        if len(description) > 500:
+            description = description[:500] + "..."
 
-        return response
+        return _TICKET_DETAILS_TEMPLATE.format(
+            id=ticket.id,
+            subject=ticket.subject,
+            status=get_status_display(ticket.status),
+            priority=get_priority_display(ticket.priority),
+            created=ticket.created_at.strftime('%B %d, %Y at %I:%M %p') if ticket.created_at else 'Unknown',
+            description=description,
+        )
 
-    except Exception as e:
-        logger.error(f"Failed to get ticket details for {ticket_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get ticket details for %s", ticket_id)
         return f"I'm having trouble accessing the details for ticket #{ticket_id}. Let me know what specific question you have about this ticket and I'll do my best to help."
 
 
@@ -0,0 +1,55 @@
+"""
+In-process cache for Q-LLM intent extraction results.
+
+Customer traffic is repetitive ("what plans do you offer?"), and the Q-LLM
+runs at temperature 0, so the same message in the same context yields the
+same structured intent. Only intents are cached: P-LLM replies depend on
+customer data and trigger tool side effects, so they are never reused.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class IntentCache:
+    """Bounded LRU cache of structured intents keyed on the normalized input."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _key(user_message: str, conversation_context: str) -> tuple:
+        """Collapse whitespace and case so trivially different inputs share a key."""
+        return (
+            " ".join(user_message.split()).casefold(),
+            " ".join(conversation_context.split()).casefold(),
+        )
+
+    async def get(
+        self, user_message: str, conversation_context: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached intent, or None on a miss."""
+        key = self._key(user_message, conversation_context)
+        intent = self._entries.get(key)
+        if intent is None:
+            return None
+        self._entries.move_to_end(key)
+        return dict(intent)
+
+    async def set(
+        self,
+        user_message: str,
+        conversation_context: str,
+        intent: Dict[str, Any],
+    ) -> None:
+        """Store an intent, evicting the least recently used entry when full."""
+        key = self._key(user_message, conversation_context)
+        self._entries[key] = dict(intent)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached intents."""
+        self._entries.clear()
@@ -0,0 +1,39 @@
+"""
+Conversation history trimming for LLM prompts.
+
+ConversationState.messages grows every turn (add_messages reducer), and each
+node re-sends that history to its LLM. Trimming to a token budget keeps the
+per-turn prompt size constant on long conversations.
+"""
+
+from typing import List
+
+from langchain_core.messages import BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+
+from src.core.config import settings
+
+
+def trim_history(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Keep the most recent messages that fit within MAX_HISTORY_TOKENS.
+
+    The trimmed history always starts on a user message, so tool results are
+    never separated from the assistant message that requested them.
+
+    Args:
+        messages: Conversation history, oldest first
+
+    Returns:
+        The most recent slice of the history within the token budget
+    """
+    if not messages:
+        return []
+
+    return trim_messages(
+        messages,
+        max_tokens=settings.MAX_HISTORY_TOKENS,
+        token_counter=count_tokens_approximately,
+        strategy="last",
+        start_on="human",
+    )
@@ -4,6 +4,7 @@ Secure tool executor with capability-based access control.
 Wraps tool execution to enforce trust-based restrictions.
 """
 
+import logging
 from typing import Any, Dict
 from src.security import (
     SecurityContext,
@@ -15,6 +16,9 @@ from src.core.logging_config import get_logger
 
 logger = get_logger("secure_tool_executor")
 
+# Trust level names from the security context, resolved once at import
+_TRUST_BY_NAME = {level.name: level for level in TrustLevel}
+
 
 async def execute_tool_securely(
     tool_func: Any,
@@ -41,59 +45,52 @@ async def execute_tool_securely(
     trust_level_str = security_context.get("trust_level", "QUARANTINED")
 
     # Map string to TrustLevel enum
-    trust_level_map = {
-        "TRUSTED": TrustLevel.TRUSTED,
-        "VERIFIED": TrustLevel.VERIFIED,
-        "UNTRUSTED": TrustLevel.UNTRUSTED,
-        "QUARANTINED": TrustLevel.QUARANTINED,
-    }
-
-    trust_level = trust_level_map.get(trust_level_str, TrustLevel.QUARANTINED)
+    trust_level = _TRUST_BY_NAME.get(trust_level_str, TrustLevel.QUARANTINED)
 
     # Get required trust level for this tool
     required_trust = TOOL_SENSITIVITY.get(tool_name, TrustLevel.VERIFIED)
 
     # Check if trust level is sufficient
     if trust_level < required_trust:
+        # Lazy %-formatting: denied calls are the adversarial path, keep them cheap
         logger.error(
-            f"🔒 CAPABILITY BLOCKED: {tool_name}",
-            extra={
-                "layer": "CAPABILITY_ENFORCEMENT",
-                "tool": tool_name,
-                "required_trust": required_trust.value,
-                "actual_trust": trust_level.value,
-                "user_id": security_context.get("user_id"),
-                "action": "DENIED",
-            },
+            "🔒 CAPABILITY BLOCKED: %s required=%s actual=%s user_id=%s",
+            tool_name,
+            required_trust.value,
+            trust_level.value,
+            security_context.get("user_id"),
         )
         raise UnauthorizedToolAccess(
             f"Tool '{tool_name}' requires trust level {required_trust.value}, "
             f"but context has {trust_level.value}"
         )
 
-    # Log successful authorization
-    logger.info(
-        f"🔓 CAPABILITY ALLOWED: {tool_name}",
-        extra={
-            "layer": "CAPABILITY_ENFORCEMENT",
-            "tool": tool_name,
-            "trust_level": trust_level.value,
-            "required_trust": required_trust.value,
-            "action": "ALLOWED",
-        },
-    )
-
-    # Execute tool
-    try:
-        result = await tool_func.ainvoke(tool_args)
+    # Log successful authorization (skip building the extra dict when INFO is off)
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    if info_enabled:
         logger.info(
-            f"✅ TOOL EXECUTED: {tool_name}",
+            f"🔓 CAPABILITY ALLOWED: {tool_name}",
             extra={
+                "layer": "CAPABILITY_ENFORCEMENT",
                 "tool": tool_name,
                 "trust_level": trust_level.value,
-                "execution": "SUCCESS",
+                "required_trust": required_trust.value,
+                "action": "ALLOWED",
             },
         )
+
+    # Execute tool
+    try:
+        result = await tool_func.ainvoke(tool_args)
+        if info_enabled:
+            logger.info(
+                f"✅ TOOL EXECUTED: {tool_name}",
+                extra={
+                    "tool": tool_name,
+                    "trust_level": trust_level.value,
+                    "execution": "SUCCESS",
+                },
+            )
         return result
     except Exception as e:
         logger.error(
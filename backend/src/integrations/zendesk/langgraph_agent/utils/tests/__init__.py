@@ -0,0 +1 @@
+"""Tests for LangGraph agent utilities."""
@@ -0,0 +1,57 @@
+"""
+Unit tests for conversation history trimming.
+
+Tests verify that the history re-sent to LLMs stays within the token budget
+without splitting tool call sequences.
+"""
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from src.core.config import settings
+from src.integrations.zendesk.langgraph_agent.utils.message_history import trim_history
+
+
+@pytest.mark.unit
+class TestTrimHistory:
+    """Test token-budgeted history trimming."""
+
+    def test_long_history_trimmed_to_budget(self, mocker):
+        """Test that only the most recent turns within the budget are kept."""
+        mocker.patch.object(settings, "MAX_HISTORY_TOKENS", 100)
+        messages = []
+        for turn in range(20):
+            messages.append(HumanMessage(content=f"Question {turn} about internet plans"))
+            messages.append(AIMessage(content=f"Answer {turn} about internet plans"))
+
+        result = trim_history(messages)
+
+        assert result[-1] is messages[-1]
+        assert isinstance(result[0], HumanMessage)
+        assert count_tokens_approximately(result) <= 100
+        assert len(result) < len(messages)
+
+    def test_short_history_unchanged(self):
+        """Test that history within the budget is passed through."""
+        messages = [HumanMessage(content="Hi"), AIMessage(content="Hello!")]
+
+        assert trim_history(messages) == messages
+
+    def test_trimmed_history_never_starts_on_tool_result(self, mocker):
+        """Test that tool results are not kept without their tool call."""
+        mocker.patch.object(settings, "MAX_HISTORY_TOKENS", 60)
+        messages = [
+            HumanMessage(content="What plans do you offer? " * 5),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "get_awesome_company_plans_pricing", "args": {}, "id": "call_1"}],
+            ),
+            ToolMessage(content="Basic plan $29.99/month", tool_call_id="call_1"),
+            AIMessage(content="We offer a Basic plan."),
+            HumanMessage(content="Thanks"),
+            AIMessage(content="You're welcome!"),
+        ]
+
+        result = trim_history(messages)
+
+        assert result == messages[-2:]
@@ -0,0 +1,51 @@
+"""
+Unit tests for capability-checked tool execution.
+
+Tests verify that the context trust level gates which tools may run.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.security import UnauthorizedToolAccess
+from src.integrations.zendesk.langgraph_agent.utils.secure_tool_executor import (
+    execute_tool_securely,
+)
+
+
+@pytest.fixture
+def tool_func():
+    """Tool whose invocation returns a fixed result."""
+    tool = MagicMock()
+    tool.ainvoke = AsyncMock(return_value="ticket created")
+    return tool
+
+
+@pytest.mark.unit
+class TestExecuteToolSecurely:
+    """Test trust-level enforcement around tool calls."""
+
+    async def test_sufficient_trust_runs_tool(self, tool_func):
+        """Test that a verified context may create tickets."""
+        result = await execute_tool_securely(
+            tool_func, "create_support_ticket", {"a": 1}, {"trust_level": "VERIFIED"}
+        )
+
+        assert result == "ticket created"
+        tool_func.ainvoke.assert_called_once_with({"a": 1})
+
+    async def test_insufficient_trust_is_denied(self, tool_func):
+        """Test that a verified context may not run trusted-only tools."""
+        with pytest.raises(UnauthorizedToolAccess):
+            await execute_tool_securely(
+                tool_func, "delete_ticket", {}, {"trust_level": "VERIFIED"}
+            )
+
+        tool_func.ainvoke.assert_not_called()
+
+    @pytest.mark.parametrize("security_context", [{}, {"trust_level": "ADMIN"}])
+    async def test_missing_or_unknown_trust_is_quarantined(self, tool_func, security_context):
+        """Test that missing or unrecognized trust levels fall back to quarantined."""
+        with pytest.raises(UnauthorizedToolAccess, match="QUARANTINED"):
+            await execute_tool_securely(
+                tool_func, "create_support_ticket", {}, security_context
+            )
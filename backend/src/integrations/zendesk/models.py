@@ -7,6 +7,8 @@ focusing on tickets and pagination.
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from pydantic import Field, TypeAdapter
+
 from src.core.models import CustomModel
 
 
@@ -18,19 +20,23 @@ class ZendeskTicket(CustomModel):
     status: str  # new, open, pending, hold, solved, closed
     priority: Optional[str] = None  # low, normal, high, urgent
     type: Optional[str] = None  # problem, incident, question, task
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
     requester_id: int
     assignee_id: Optional[int] = None
     organization_id: Optional[int] = None
-    custom_fields: List[Dict[str, Any]] = []
+    custom_fields: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+# Validates a whole list of raw tickets in one pydantic-core call
+TICKET_LIST_ADAPTER = TypeAdapter(List[ZendeskTicket])
 
 
 class ZendeskResponse(CustomModel):
     """Generic Zendesk API response wrapper."""
     ticket: Optional[ZendeskTicket] = None
-    tickets: Optional[List[ZendeskTicket]] = []
+    tickets: Optional[List[ZendeskTicket]] = Field(default_factory=list)
     count: Optional[int] = None
     next_page: Optional[str] = None
     previous_page: Optional[str] = None
@@ -57,4 +63,4 @@ class PaginatedResponse(CustomModel):
 
 class PaginatedTicketsResponse(PaginatedResponse):
     """Paginated tickets response."""
-    tickets: List[ZendeskTicket] = []
+    tickets: List[ZendeskTicket] = Field(default_factory=list)
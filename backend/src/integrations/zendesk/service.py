@@ -4,9 +4,12 @@ Business logic service for Zendesk ticket operations.
 This module contains the business logic for ticket operations,
 providing reusable service methods for the AI agent.
 """
-from typing import List, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
-from .client import ZendeskClient
+from .client import ZendeskClient, get_shared_zendesk_client
 from .exceptions import ZendeskAPIError
 from .models import ZendeskTicket
 from .utils import handle_zendesk_api_error, handle_unexpected_error
@@ -16,12 +19,60 @@ from src.core.logging_config import get_logger, log_with_context
 logger = get_logger("zendesk_service")
 
 
+class TTLCache:
+    """Bounded LRU cache whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+# Shared across services so repeat lookups within a conversation skip the API
+_ticket_cache = TTLCache(maxsize=1024, ttl=30)
+_email_cache = TTLCache(maxsize=512, ttl=15)
+
+
+def _email_cache_key(email: str) -> str:
+    """Normalize an email so differently-cased spellings share a cache entry."""
+    return email.strip().lower()
+
+
 class TicketService:
     """Service class for ticket operations."""
 
     def __init__(self, zendesk_client: ZendeskClient):
         """Initialize the service with a Zendesk client."""
         self.client = zendesk_client
+        self.ticket_cache = _ticket_cache
+        self.email_cache = _email_cache
 
     async def get_ticket_by_id(self, ticket_id: int) -> ZendeskTicket:
         """
@@ -36,6 +87,10 @@ class TicketService:
         Raises:
             HTTPException: For various API errors
         """
+        cached_ticket = self.ticket_cache.get(ticket_id)
+        if cached_ticket is not None:
+            return cached_ticket
+
         try:
             log_with_context(
                 logger,
@@ -45,6 +100,7 @@ class TicketService:
             )
 
             ticket = await self.client.get_ticket(ticket_id)
+            self.ticket_cache.set(ticket_id, ticket)
 
             log_with_context(
                 logger,
@@ -70,6 +126,23 @@ class TicketService:
                 context={"ticket_id": ticket_id}
             )
 
+    async def get_tickets_by_ids(self, ticket_ids: List[int]) -> List[ZendeskTicket]:
+        """
+        Get several tickets by ID, fetching them concurrently.
+
+        Args:
+            ticket_ids: The ticket IDs to retrieve
+
+        Returns:
+            ZendeskTicket models in the same order as ticket_ids
+
+        Raises:
+            HTTPException: For various API errors
+        """
+        return list(await asyncio.gather(
+            *(self.get_ticket_by_id(ticket_id) for ticket_id in ticket_ids)
+        ))
+
     async def create_ticket(
         self,
         subject: str,
@@ -119,6 +192,11 @@ class TicketService:
                 tags=tags
             )
 
+            # The requester's ticket list changed; drop the stale search result
+            if requester_email:
+                self.email_cache.pop(_email_cache_key(requester_email))
+            self.ticket_cache.set(ticket.id, ticket)
+
             log_with_context(
                 logger,
                 20,  # INFO
@@ -167,6 +245,10 @@ class TicketService:
         Raises:
             HTTPException: For various API errors
         """
+        cached_tickets = self.email_cache.get(_email_cache_key(customer_email))
+        if cached_tickets is not None:
+            return list(cached_tickets)
+
         try:
             log_with_context(
                 logger,
@@ -176,6 +258,7 @@ class TicketService:
             )
 
             tickets = await self.client.search_tickets_by_email(customer_email)
+            self.email_cache.set(_email_cache_key(customer_email), tuple(tickets))
 
             log_with_context(
                 logger,
@@ -199,4 +282,66 @@ class TicketService:
                 error=e,
                 operation="searching tickets by email",
                 context={"email": customer_email}
-            )
\ No newline at end of file
+            )
+
+    async def search_tickets_by_emails(
+        self, customer_emails: List[str]
+    ) -> Dict[str, List[ZendeskTicket]]:
+        """
+        Search tickets for several customer emails, in one request for cache misses.
+
+        Args:
+            customer_emails: Customer email addresses to search for
+
+        Returns:
+            Mapping of each email to its matching ZendeskTicket models
+
+        Raises:
+            HTTPException: For various API errors
+        """
+        results = {}
+        missing_emails = []
+        for email in dict.fromkeys(customer_emails):
+            cached_tickets = self.email_cache.get(_email_cache_key(email))
+            if cached_tickets is None:
+                missing_emails.append(email)
+            else:
+                results[email] = list(cached_tickets)
+
+        if not missing_emails:
+            return results
+
+        try:
+            fetched = await self.client.search_tickets_by_emails(missing_emails)
+
+        except ZendeskAPIError as e:
+            handle_zendesk_api_error(
+                error=e,
+                operation="searching tickets by emails",
+                context={"email_count": len(missing_emails)}
+            )
+
+        except Exception as e:
+            handle_unexpected_error(
+                error=e,
+                operation="searching tickets by emails",
+                context={"email_count": len(missing_emails)}
+            )
+
+        for email, tickets in fetched.items():
+            self.email_cache.set(_email_cache_key(email), tuple(tickets))
+            results[email] = list(tickets)
+
+        return results
+
+
+_shared_service: Optional[TicketService] = None
+
+
+async def get_shared_ticket_service() -> TicketService:
+    """Get the TicketService bound to the shared Zendesk client."""
+    global _shared_service
+    zendesk_client = await get_shared_zendesk_client()
+    if _shared_service is None or _shared_service.client is not zendesk_client:
+        _shared_service = TicketService(zendesk_client)
+    return _shared_service
@@ -30,6 +30,7 @@ def mock_config():
     config.BACKOFF_FACTOR = 1.0
     config.DEFAULT_PAGE_SIZE = 100
     config.MAX_PAGE_SIZE = 100
+    config.SEARCH_RESULT_LIMIT = 1000
     config.RATE_LIMIT_RETRY_AFTER = 60
     return config
 
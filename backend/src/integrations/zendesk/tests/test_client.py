@@ -6,7 +6,15 @@ import pytest_asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 import base64
 
-from src.integrations.zendesk.client import ZendeskClient, ZendeskPaginator, get_zendesk_client
+from src.integrations.zendesk import client as client_module
+from src.integrations.zendesk.client import (
+    ZendeskClient,
+    ZendeskPaginator,
+    get_zendesk_client,
+    get_shared_zendesk_client,
+    close_shared_zendesk_client,
+    warm_up_shared_zendesk_client
+)
 from src.integrations.zendesk.exceptions import ZendeskAPIError
 from src.integrations.zendesk.models import ZendeskTicket, PaginatedTicketsResponse
 
@@ -135,6 +143,132 @@ class TestSimplifiedZendeskClient:
         assert all(isinstance(ticket, ZendeskTicket) for ticket in result)
         assert zendesk_client._make_request.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_email_keeps_only_tickets(self, zendesk_client, sample_ticket_data):
+        """Test search parses ticket results and skips other result types."""
+        zendesk_client._make_request = AsyncMock(return_value={
+            "results": [
+                {**sample_ticket_data, "result_type": "ticket"},
+                {"id": 1, "name": "Some User", "result_type": "user"},
+                {**sample_ticket_data, "id": 124, "result_type": "ticket"},
+            ]
+        })
+
+        result = await zendesk_client.search_tickets_by_email("test@example.com")
+
+        assert [ticket.id for ticket in result] == [123, 124]
+        assert all(isinstance(ticket, ZendeskTicket) for ticket in result)
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_emails_groups_by_requester(self, zendesk_client, sample_ticket_data):
+        """Test one search covers several emails and groups tickets by requester."""
+        zendesk_client._make_request = AsyncMock(return_value={
+            "results": [
+                {**sample_ticket_data, "id": 1, "requester_id": 10, "result_type": "ticket"},
+                {**sample_ticket_data, "id": 2, "requester_id": 20, "result_type": "ticket"},
+                {**sample_ticket_data, "id": 3, "requester_id": 10, "result_type": "ticket"},
+            ],
+            "users": [
+                {"id": 10, "email": "a@example.com"},
+                {"id": 20, "email": "B@example.com"},
+            ]
+        })
+
+        result = await zendesk_client.search_tickets_by_emails(
+            ["a@example.com", "b@example.com", "c@example.com"]
+        )
+
+        assert {email: [t.id for t in tickets] for email, tickets in result.items()} == {
+            "a@example.com": [1, 3],
+            "b@example.com": [2],
+            "c@example.com": [],
+        }
+        zendesk_client._make_request.assert_called_once()
+        params = zendesk_client._make_request.call_args.kwargs["params"]
+        assert params["query"] == (
+            "type:ticket requester:a@example.com requester:b@example.com requester:c@example.com"
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_emails_follows_next_page(self, zendesk_client, sample_ticket_data):
+        """Test tickets on later search pages are still grouped by requester."""
+        zendesk_client._make_request = AsyncMock(side_effect=[
+            {
+                "results": [
+                    {**sample_ticket_data, "id": 1, "requester_id": 10, "result_type": "ticket"},
+                ],
+                "users": [{"id": 10, "email": "a@example.com"}],
+                "next_page": "https://test.zendesk.com/api/v2/search.json?page=2"
+            },
+            {
+                "results": [
+                    {**sample_ticket_data, "id": 2, "requester_id": 20, "result_type": "ticket"},
+                ],
+                "users": [{"id": 20, "email": "b@example.com"}],
+                "next_page": None
+            },
+        ])
+
+        result = await zendesk_client.search_tickets_by_emails(["a@example.com", "b@example.com"])
+
+        assert {email: [t.id for t in tickets] for email, tickets in result.items()} == {
+            "a@example.com": [1],
+            "b@example.com": [2],
+        }
+        pages = [call.kwargs["params"]["page"] for call in zendesk_client._make_request.call_args_list]
+        assert pages == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_emails_stops_at_result_limit(
+        self, zendesk_client, mock_config, sample_ticket_data
+    ):
+        """Test pages past the Search API result limit are never requested."""
+        mock_config.SEARCH_RESULT_LIMIT = 300
+        zendesk_client._make_request = AsyncMock(return_value={
+            "results": [
+                {**sample_ticket_data, "id": 1, "requester_id": 10, "result_type": "ticket"},
+            ],
+            "users": [{"id": 10, "email": "a@example.com"}],
+            "next_page": "https://test.zendesk.com/api/v2/search.json?page=next"
+        })
+
+        with patch('src.integrations.zendesk.client.log_with_context') as mock_log:
+            result = await zendesk_client.search_tickets_by_emails(["a@example.com"])
+
+        pages = [call.kwargs["params"]["page"] for call in zendesk_client._make_request.call_args_list]
+        assert pages == [1, 2, 3]
+        assert len(result["a@example.com"]) == 3
+        assert any(
+            "truncated" in call.args[2] for call in mock_log.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_emails_user_without_email(self, zendesk_client, sample_ticket_data):
+        """Test side-loaded users with a null email don't fail the lookup."""
+        zendesk_client._make_request = AsyncMock(return_value={
+            "results": [
+                {**sample_ticket_data, "id": 1, "requester_id": 10, "result_type": "ticket"},
+                {**sample_ticket_data, "id": 2, "requester_id": 30, "result_type": "ticket"},
+            ],
+            "users": [
+                {"id": 10, "email": "a@example.com"},
+                {"id": 30, "email": None},
+            ]
+        })
+
+        result = await zendesk_client.search_tickets_by_emails(["a@example.com"])
+
+        assert [ticket.id for ticket in result["a@example.com"]] == [1]
+
+    @pytest.mark.asyncio
+    async def test_healthcheck(self, zendesk_client):
+        """Test healthcheck makes a cheap authenticated request."""
+        zendesk_client._make_request = AsyncMock(return_value={"user": {"id": 1}})
+
+        await zendesk_client.healthcheck()
+
+        zendesk_client._make_request.assert_called_once_with("GET", "users/me.json")
+
     @pytest.mark.asyncio
     async def test_get_zendesk_client_factory(self, mock_config):
         """Test factory function creates and connects client."""
@@ -147,6 +281,44 @@ class TestSimplifiedZendeskClient:
             assert result is mock_client
             mock_client.connect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_shared_client_connects_once(self, monkeypatch):
+        """Test shared client is connected on first use and then reused."""
+        monkeypatch.setattr(client_module, "_shared_client", None)
+        with patch('src.integrations.zendesk.client.ZendeskClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            first = await get_shared_zendesk_client()
+            second = await get_shared_zendesk_client()
+
+            assert first is second is mock_client
+            mock_client_class.assert_called_once()
+            mock_client.connect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_client(self, monkeypatch):
+        """Test closing the shared client disconnects it and allows reconnecting."""
+        mock_client = AsyncMock()
+        monkeypatch.setattr(client_module, "_shared_client", mock_client)
+
+        await close_shared_zendesk_client()
+        await close_shared_zendesk_client()
+
+        mock_client.disconnect.assert_called_once()
+        assert client_module._shared_client is None
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_is_not_raised(self, monkeypatch):
+        """Test a failed warm-up only logs, leaving connection to first use."""
+        mock_client = AsyncMock()
+        mock_client.healthcheck.side_effect = ZendeskAPIError("unreachable")
+        monkeypatch.setattr(client_module, "_shared_client", mock_client)
+
+        await warm_up_shared_zendesk_client()
+
+        mock_client.healthcheck.assert_called_once()
+
 
 class TestZendeskPaginator:
     """Test ZendeskPaginator functionality."""
@@ -0,0 +1,187 @@
+"""
+Unit tests for TicketService caching and sharing.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.integrations.zendesk import service as service_module
+from src.integrations.zendesk.models import ZendeskTicket
+from src.integrations.zendesk.service import (
+    TicketService,
+    TTLCache,
+    get_shared_ticket_service
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_ticket_caches():
+    """Keep cached lookups from leaking between tests."""
+    service_module._ticket_cache.clear()
+    service_module._email_cache.clear()
+    yield
+    service_module._ticket_cache.clear()
+    service_module._email_cache.clear()
+
+
+@pytest.fixture
+def ticket_service(zendesk_client):
+    """TicketService on the mocked Zendesk client."""
+    return TicketService(zendesk_client)
+
+
+class TestTTLCache:
+    """Test the TTL-bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are dropped once their TTL has passed."""
+        now = [100.0]
+        monkeypatch.setattr(service_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+
+        now[0] += 29
+        assert cache.get("a") == 1
+
+        now[0] += 1
+        assert cache.get("a") is None
+
+
+class TestTicketServiceCaching:
+    """Test TicketService serves repeat lookups from memory."""
+
+    @pytest.mark.asyncio
+    async def test_get_ticket_by_id_cached(self, ticket_service, zendesk_client, mock_ticket):
+        """Test repeat ticket lookups call the API once."""
+        zendesk_client.get_ticket = AsyncMock(return_value=mock_ticket)
+
+        first = await ticket_service.get_ticket_by_id(123)
+        second = await ticket_service.get_ticket_by_id(123)
+
+        assert first is second is mock_ticket
+        zendesk_client.get_ticket.assert_called_once_with(123)
+
+    @pytest.mark.asyncio
+    async def test_get_tickets_by_ids_keeps_order(self, ticket_service, zendesk_client, sample_ticket_data):
+        """Test batch lookups return tickets in the requested order."""
+        async def fake_get_ticket(ticket_id):
+            return ZendeskTicket(**{**sample_ticket_data, "id": ticket_id})
+
+        zendesk_client.get_ticket = AsyncMock(side_effect=fake_get_ticket)
+
+        tickets = await ticket_service.get_tickets_by_ids([3, 1, 2])
+
+        assert [ticket.id for ticket in tickets] == [3, 1, 2]
+        assert zendesk_client.get_ticket.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_email_cached(self, ticket_service, zendesk_client, mock_ticket):
+        """Test repeat email searches call the API once."""
+        zendesk_client.search_tickets_by_email = AsyncMock(return_value=[mock_ticket])
+
+        first = await ticket_service.search_tickets_by_email("john@example.com")
+        second = await ticket_service.search_tickets_by_email("john@example.com")
+
+        assert first == second == [mock_ticket]
+        zendesk_client.search_tickets_by_email.assert_called_once_with("john@example.com")
+
+    @pytest.mark.asyncio
+    async def test_create_ticket_invalidates_requester_search(
+        self, ticket_service, zendesk_client, mock_ticket
+    ):
+        """Test creating a ticket drops the requester's cached search."""
+        zendesk_client.search_tickets_by_email = AsyncMock(return_value=[])
+        zendesk_client.create_ticket = AsyncMock(return_value=mock_ticket)
+
+        await ticket_service.search_tickets_by_email("john@example.com")
+        await ticket_service.create_ticket(
+            subject="Help",
+            description="Need help",
+            requester_email="john@example.com"
+        )
+        await ticket_service.search_tickets_by_email("john@example.com")
+
+        assert zendesk_client.search_tickets_by_email.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_email_cache_ignores_case(self, ticket_service, zendesk_client, mock_ticket):
+        """Test creating a ticket invalidates a search cached under another spelling."""
+        zendesk_client.search_tickets_by_email = AsyncMock(return_value=[])
+        zendesk_client.create_ticket = AsyncMock(return_value=mock_ticket)
+
+        await ticket_service.search_tickets_by_email("John@Example.com")
+        await ticket_service.search_tickets_by_email(" john@example.com ")
+        assert zendesk_client.search_tickets_by_email.call_count == 1
+
+        await ticket_service.create_ticket(
+            subject="Help",
+            description="Need help",
+            requester_email="john@example.com"
+        )
+        await ticket_service.search_tickets_by_email("John@Example.com")
+
+        assert zendesk_client.search_tickets_by_email.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_tickets_by_emails_only_fetches_misses(
+        self, ticket_service, zendesk_client, mock_ticket
+    ):
+        """Test bulk search serves cached emails and fetches the rest in one call."""
+        zendesk_client.search_tickets_by_email = AsyncMock(return_value=[mock_ticket])
+        zendesk_client.search_tickets_by_emails = AsyncMock(
+            return_value={"new@example.com": []}
+        )
+
+        await ticket_service.search_tickets_by_email("john@example.com")
+        result = await ticket_service.search_tickets_by_emails(
+            ["john@example.com", "new@example.com", "new@example.com"]
+        )
+
+        assert result == {"john@example.com": [mock_ticket], "new@example.com": []}
+        zendesk_client.search_tickets_by_emails.assert_called_once_with(["new@example.com"])
+
+
+class TestSharedTicketService:
+    """Test the TicketService bound to the shared Zendesk client."""
+
+    @pytest.mark.asyncio
+    async def test_reused_while_client_unchanged(self, monkeypatch):
+        """Test the same service is returned for the same shared client."""
+        monkeypatch.setattr(service_module, "_shared_service", None)
+        mock_client = AsyncMock()
+
+        with patch(
+            'src.integrations.zendesk.service.get_shared_zendesk_client',
+            AsyncMock(return_value=mock_client)
+        ):
+            first = await get_shared_ticket_service()
+            second = await get_shared_ticket_service()
+
+        assert first is second
+        assert first.client is mock_client
+
+    @pytest.mark.asyncio
+    async def test_rebound_after_client_replaced(self, monkeypatch):
+        """Test a new service is built once the shared client is reconnected."""
+        monkeypatch.setattr(service_module, "_shared_service", None)
+
+        with patch(
+            'src.integrations.zendesk.service.get_shared_zendesk_client',
+            AsyncMock(side_effect=[AsyncMock(), AsyncMock()])
+        ):
+            first = await get_shared_ticket_service()
+            second = await get_shared_ticket_service()
+
+        assert first is not second
+        assert first.client is not second.client
@@ -0,0 +1,79 @@
+"""
+Unit tests for keyword-based ticket intent classification.
+"""
+import pytest
+
+from src.integrations.zendesk.ticket_classifier import (
+    MyAwesomeFakeCompanyTicketClassifier,
+    TicketIntent,
+)
+
+
+@pytest.fixture
+def classifier():
+    """Ticket classifier instance."""
+    return MyAwesomeFakeCompanyTicketClassifier()
+
+
+class TestClassifyIntent:
+    """Test intent scoring from message keywords."""
+
+    @pytest.mark.parametrize("message, expected", [
+        ("I want to BUY a new service plan", TicketIntent.SALES),
+        ("My bill has an overcharge, I need a refund", TicketIntent.BILLING),
+        ("Please cancel and disconnect my account", TicketIntent.CANCELLATION),
+        ("My wifi router is not working", TicketIntent.TECHNICAL_SUPPORT),
+        ("What are your office hours?", TicketIntent.GENERAL_INQUIRY),
+        ("", TicketIntent.GENERAL_INQUIRY),
+    ])
+    def test_classifies_by_keywords(self, classifier, message, expected):
+        """Test that the intent with the most keyword matches wins."""
+        assert classifier.classify_intent(message) == expected
+
+    def test_repeated_keyword_scores_once(self, classifier):
+        """Test that repeating one keyword does not outweigh distinct keywords."""
+        message = "slow slow slow slow, but can I get a refund on my invoice?"
+
+        assert classifier.classify_intent(message) == TicketIntent.BILLING
+
+    def test_keywords_match_inside_words(self, classifier):
+        """Test that keywords match word prefixes, like 'bill' in 'billed'."""
+        assert classifier.classify_intent("I was billed twice") == TicketIntent.BILLING
+
+    def test_longest_keyword_wins_over_its_prefix(self, classifier):
+        """Test that 'cancellation' scores once rather than also as 'cancel'."""
+        message = "cancellation refund"
+
+        assert classifier.classify_intent(message) == TicketIntent.BILLING
+
+    def test_keywords_must_start_a_word(self, classifier):
+        """Test that keywords inside another word, like 'subscribe' in 'unsubscribe', don't score."""
+        assert classifier.classify_intent("please unsubscribe me") == TicketIntent.CANCELLATION
+        assert classifier.classify_intent("I can repay later") == TicketIntent.GENERAL_INQUIRY
+
+    def test_ties_resolve_in_intent_order(self, classifier):
+        """Test that equal scores resolve to the earlier declared intent."""
+        assert classifier.classify_intent("upgrade my router") == TicketIntent.SALES
+
+
+class TestClassifyAndFormat:
+    """Test Zendesk ticket data built from a classification."""
+
+    def test_formats_ticket_for_intent(self, classifier):
+        """Test ticket fields come from the matched intent's config."""
+        result = classifier.classify_and_format("I need a refund for my bill")
+
+        assert result["intent"] == "billing"
+        assert result["subject"] == "[BILLING] Customer Support Request"
+        assert result["type"] == "problem"
+        assert result["priority"] == "high"
+        assert "I need a refund for my bill" in result["description"]
+
+    def test_tags_are_a_fresh_list(self, classifier):
+        """Test callers get a mutable copy of the read-only config tags."""
+        tags = classifier.classify_and_format("I need a refund")["tags"]
+        tags.append("mutated")
+
+        assert classifier.classify_and_format("I need a refund")["tags"] == [
+            "billing", "payment", "customer_service"
+        ]
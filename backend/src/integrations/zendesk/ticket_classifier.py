@@ -4,9 +4,12 @@ Ticket classification system for MyAwesomeFakeCompany customer support.
 This module classifies customer intentions and maps them to appropriate
 Zendesk ticket types, priorities, and tags for proper routing and handling.
 """
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
-from pydantic import BaseModel
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import ahocorasick
 
 class TicketIntent(Enum):
     """Customer intent categories for ticket classification."""
@@ -16,26 +19,48 @@ class TicketIntent(Enum):
     TECHNICAL_SUPPORT = "technical_support"  # Technical issues, outages, equipment problems
     GENERAL_INQUIRY = "general_inquiry"  # General questions, company info
 
-class TicketClassification(BaseModel):
+# Static config shared by every classification, so no validation is needed
+@dataclass(frozen=True, slots=True)
+class TicketClassification:
     """Classification result for customer intent."""
     intent: TicketIntent
     zendesk_type: str  # Zendesk ticket type: problem, incident, question, task
     priority: str  # Zendesk priority: low, normal, high, urgent
-    tags: List[str]  # Tags for categorization and routing
+    tags: Tuple[str, ...]  # Tags for categorization and routing
     subject_prefix: str  # Prefix for ticket subject
     description_template: str  # Template for ticket description
 
 
+def _build_keyword_automaton(
+    intent_keywords: Dict[TicketIntent, List[str]]
+) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton matching every intent keyword in one pass."""
+    intents_by_keyword: Dict[str, List[TicketIntent]] = {}
+    for intent, keywords in intent_keywords.items():
+        for keyword in keywords:
+            intents_by_keyword.setdefault(keyword.lower(), []).append(intent)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, intents in intents_by_keyword.items():
+        automaton.add_word(keyword, (keyword, tuple(intents)))
+    automaton.make_automaton()
+    return automaton
+
+
+# Every intent in declaration order, so ties keep resolving to the earliest intent
+_ZERO_SCORES = {intent: 0 for intent in TicketIntent}
+
+
 class MyAwesomeFakeCompanyTicketClassifier:
     """Classifier for MyAwesomeFakeCompany customer support tickets."""
 
     # Classification mapping based on customer intent
-    INTENT_MAPPINGS: Dict[TicketIntent, TicketClassification] = {
+    INTENT_MAPPINGS: Mapping[TicketIntent, TicketClassification] = MappingProxyType({
         TicketIntent.SALES: TicketClassification(
             intent=TicketIntent.SALES,
             zendesk_type="task",
             priority="normal",
-            tags=["sales", "new_customer", "revenue_opportunity"],
+            tags=("sales", "new_customer", "revenue_opportunity"),
             subject_prefix="[SALES]",
             description_template="Customer interested in MyAwesomeFakeCompany services.\n\nCustomer Details:\n{customer_info}\n\nRequest Summary:\n{request_summary}\n\nNext Steps:\n- Follow up within 24 hours\n- Provide service consultation\n- Send pricing information"
         ),
@@ -44,7 +69,7 @@ class MyAwesomeFakeCompanyTicketClassifier:
             intent=TicketIntent.BILLING,
             zendesk_type="problem",
             priority="high",
-            tags=["billing", "payment", "customer_service"],
+            tags=("billing", "payment", "customer_service"),
             subject_prefix="[BILLING]",
             description_template="Customer has a billing-related issue.\n\nCustomer Details:\n{customer_info}\n\nBilling Issue:\n{request_summary}\n\nPriority Actions:\n- Review account billing history\n- Investigate payment processing\n- Resolve within 48 hours"
         ),
@@ -53,7 +78,7 @@ class MyAwesomeFakeCompanyTicketClassifier:
             intent=TicketIntent.CANCELLATION,
             zendesk_type="task",
             priority="high",
-            tags=["cancellation", "retention", "churn_risk"],
+            tags=("cancellation", "retention", "churn_risk"),
             subject_prefix="[RETENTION]",
             description_template="Customer requesting service cancellation.\n\nCustomer Details:\n{customer_info}\n\nCancellation Request:\n{request_summary}\n\nRetention Actions:\n- Understand cancellation reason\n- Offer retention options\n- Process if necessary\n- Schedule follow-up"
         ),
@@ -62,7 +87,7 @@ class MyAwesomeFakeCompanyTicketClassifier:
             intent=TicketIntent.TECHNICAL_SUPPORT,
             zendesk_type="incident",
             priority="normal",
-            tags=["technical", "support", "troubleshooting"],
+            tags=("technical", "support", "troubleshooting"),
             subject_prefix="[TECH]",
             description_template="Customer experiencing technical issues.\n\nCustomer Details:\n{customer_info}\n\nTechnical Issue:\n{request_summary}\n\nTroubleshooting Steps:\n- Diagnose issue remotely\n- Provide step-by-step resolution\n- Escalate to field tech if needed"
         ),
@@ -71,11 +96,11 @@ class MyAwesomeFakeCompanyTicketClassifier:
             intent=TicketIntent.GENERAL_INQUIRY,
             zendesk_type="question",
             priority="low",
-            tags=["general", "inquiry", "information"],
+            tags=("general", "inquiry", "information"),
             subject_prefix="[INFO]",
             description_template="General customer inquiry.\n\nCustomer Details:\n{customer_info}\n\nInquiry:\n{request_summary}\n\nResponse Actions:\n- Provide accurate information\n- Route to appropriate department if needed"
         )
-    }
+    })
 
     # Keywords for intent classification
     INTENT_KEYWORDS = {
@@ -104,6 +129,9 @@ class MyAwesomeFakeCompanyTicketClassifier:
         ]
     }
 
+    # Built once; scanning a message for every keyword is a single C-level pass
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(INTENT_KEYWORDS)
+
     def classify_intent(self, message_content: str) -> TicketIntent:
         """
         Classify customer intent based on message content.
@@ -117,12 +145,21 @@ class MyAwesomeFakeCompanyTicketClassifier:
         message_lower = message_content.lower()
 
         # Score each intent based on keyword matches
-        intent_scores = {intent: 0 for intent in TicketIntent}
-
-        for intent, keywords in self.INTENT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    intent_scores[intent] += 1
+        intent_scores = _ZERO_SCORES.copy()
+
+        # Each keyword scores once, however often it occurs in the message.
+        # Only the longest keyword starting at a word boundary counts, so
+        # "cancellation" doesn't also score "cancel" and "unsubscribe" doesn't
+        # score "subscribe"; prefixes still match inflections like "billed".
+        matched_keywords = set()
+        for end_index, match in self._KEYWORD_AUTOMATON.iter_long(message_lower):
+            start_index = end_index - len(match[0]) + 1
+            if start_index and message_lower[start_index - 1].isalnum():
+                continue
+            matched_keywords.add(match)
+        for _, intents in matched_keywords:
+            for intent in intents:
+                intent_scores[intent] += 1
 
         # Return intent with highest score, default to GENERAL_INQUIRY
         best_intent = max(intent_scores, key=intent_scores.get)
@@ -185,7 +222,7 @@ class MyAwesomeFakeCompanyTicketClassifier:
             "description": description,
             "type": classification.zendesk_type,
             "priority": classification.priority,
-            "tags": classification.tags
+            "tags": list(classification.tags)
         }
 
 
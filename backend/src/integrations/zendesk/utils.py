@@ -4,6 +4,7 @@ Utility functions for Zendesk integration.
 This module provides reusable utility functions to reduce code duplication
 across the Zendesk integration components.
 """
+import logging
 from typing import Optional, Any, Dict
 from src.core.logging_config import get_logger, log_with_context
 
@@ -43,21 +44,25 @@ def handle_zendesk_api_error(
         ZendeskBadRequestException: For client errors (4xx)
         ZendeskServiceUnavailableException: For other API errors
     """
-    log_context = {
-        "error": str(error),
-        "status_code": error.status_code,
-        "operation": operation
-    }
-
-    if context:
-        log_context.update(context)
-
-    log_with_context(
-        logger,
-        40,  # ERROR
-        f"Zendesk API error during {operation}",
-        **log_context
-    )
+    error_str = str(error)
+
+    # Skip building the log context when ERROR records would be dropped anyway
+    if logger.isEnabledFor(logging.ERROR):
+        log_context = {
+            "error": error_str,
+            "status_code": error.status_code,
+            "operation": operation
+        }
+
+        if context:
+            log_context.update(context)
+
+        log_with_context(
+            logger,
+            40,  # ERROR
+            f"Zendesk API error during {operation}",
+            **log_context
+        )
 
     # Map ZendeskAPIError to appropriate custom exception
     if error.is_not_found_error:
@@ -70,9 +75,9 @@ def handle_zendesk_api_error(
     elif error.is_rate_limit_error:
         raise ZendeskRateLimitException("Rate limit exceeded. Please try again later.")
     elif error.is_client_error:
-        raise ZendeskBadRequestException(f"Invalid request: {str(error)}")
+        raise ZendeskBadRequestException(f"Invalid request: {error_str}")
     else:
-        raise ZendeskServiceUnavailableException(f"Zendesk API error: {str(error)}")
+        raise ZendeskServiceUnavailableException(f"Zendesk API error: {error_str}")
 
 
 def handle_unexpected_error(
@@ -91,21 +96,24 @@ def handle_unexpected_error(
     Raises:
         InternalServerException: Always raises this for unexpected errors
     """
-    log_context = {
-        "error": str(error),
-        "error_type": type(error).__name__,
-        "operation": operation
-    }
-
-    # Add any additional context provided
-    if context:
-        log_context.update(context)
-
-    log_with_context(
-        logger,
-        40,  # ERROR
-        f"Unexpected error during {operation}",
-        **log_context
-    )
-
-    raise InternalServerException(f"Internal server error: {str(error)}")
\ No newline at end of file
+    error_str = str(error)
+
+    if logger.isEnabledFor(logging.ERROR):
+        log_context = {
+            "error": error_str,
+            "error_type": type(error).__name__,
+            "operation": operation
+        }
+
+        # Add any additional context provided
+        if context:
+            log_context.update(context)
+
+        log_with_context(
+            logger,
+            40,  # ERROR
+            f"Unexpected error during {operation}",
+            **log_context
+        )
+
+    raise InternalServerException(f"Internal server error: {error_str}")
\ No newline at end of file
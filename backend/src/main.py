@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
@@ -12,11 +15,33 @@ from src.core.error_handlers import (
 )
 from src.core.logging_config import setup_logging, get_logger
 from src.core.middleware import LoggingMiddleware, RequestContextMiddleware
+from src.integrations.zendesk.client import (
+    close_shared_zendesk_client,
+    warm_up_shared_zendesk_client,
+)
+from src.integrations.zendesk.langgraph_agent.tools.knowledge_utils import (
+    preload_knowledge_base,
+)
 
 setup_logging()
 logger = get_logger("main")
 
 
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Parse the static knowledge base once so tool calls never touch the PDFs
+    try:
+        file_count = await preload_knowledge_base()
+        logger.info(f"Preloaded {file_count} knowledge base files")
+    except Exception as e:
+        logger.warning(f"Knowledge base preload failed, files load on demand: {e}")
+    # Open the Zendesk connection in the background so the first ticket skips DNS/TLS setup
+    warm_up_task = asyncio.create_task(warm_up_shared_zendesk_client())
+    yield
+    warm_up_task.cancel()
+    await close_shared_zendesk_client()
+
+
 def create_application() -> FastAPI:
     logger.info("Creating FastAPI application")
 
@@ -27,7 +52,7 @@ def create_application() -> FastAPI:
         "openapi_url": "/api/v1/openapi.json",
     }
 
-    application = FastAPI(**app_configs)
+    application = FastAPI(**app_configs, lifespan=lifespan)
 
     application.add_middleware(RequestContextMiddleware)
     application.add_middleware(LoggingMiddleware)
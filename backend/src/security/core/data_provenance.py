@@ -36,13 +36,16 @@ class TrustLevel(str, Enum):
     
     def __lt__(self, other):
         """Enable trust level comparison."""
-        levels = {
-            TrustLevel.QUARANTINED: 0,
-            TrustLevel.UNTRUSTED: 1,
-            TrustLevel.VERIFIED: 2,
-            TrustLevel.TRUSTED: 3
-        }
-        return levels.get(self, 0) < levels.get(other, 0)
+        return _TRUST_RANK.get(self, 0) < _TRUST_RANK.get(other, 0)
+
+
+# Ordering used by TrustLevel comparisons, built once
+_TRUST_RANK = {
+    TrustLevel.QUARANTINED: 0,
+    TrustLevel.UNTRUSTED: 1,
+    TrustLevel.VERIFIED: 2,
+    TrustLevel.TRUSTED: 3
+}
 
 
 class DataProvenance(BaseModel):